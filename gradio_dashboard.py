@@ -3,9 +3,9 @@ USAA Y-9C Financial Dashboard
 Gradio interface for viewing quarterly financial data with Y-o-Y comparisons
 """
 
-import gradio as gr
 import pandas as pd
 import sqlite3
+import functools
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from pathlib import Path
@@ -14,25 +14,178 @@ import numpy as np
 # Database path
 DB_PATH = Path(__file__).parent / "data" / "usaa_y9c.db"
 
+# Upper bound on points sent to Plotly per trace; longer series are downsampled
+MAX_CHART_POINTS = 1000
+
+# Headline metrics shown in the summary cards, in display order
+KEY_METRICS = (
+    ("BHCK2170", "Total Assets"),
+    ("BHCK3210", "Total Equity"),
+    ("BHCKB528", "Net Loans"),
+    ("BHCK4074", "Net Interest Income"),
+    ("BHCK4340", "Net Income"),
+    ("BHCK4079", "Noninterest Income"),
+)
+
+# Summary card markup, filled in by create_summary_html; one border color per row
+SUMMARY_CARD_TEMPLATE = (
+    '<div style="flex: 1; text-align: center; padding: 15px; background: #f8f9fa; border-radius: 8px; border-left: 4px solid {border};">'
+    '<div style="font-size: 14px; color: #666; margin-bottom: 5px;">{name}</div>'
+    '<div style="font-size: 24px; font-weight: bold; color: #333;">{value}</div>'
+    '<div style="font-size: 12px; color: {color}; margin-top: 5px;">{yoy}</div>'
+    '</div>'
+)
+SUMMARY_CARD_BORDERS = ("#2E86AB", "#A23B72")
+
+# Metric groups plotted by each dashboard chart
+BALANCE_METRICS = (
+    ("BHCK2170", "Total Assets"),
+    ("BHCK3210", "Total Equity"),
+    ("BHCKB528", "Net Loans"),
+)
+INCOME_METRICS = (
+    ("BHCK4074", "Net Interest Income"),
+    ("BHCK4079", "Noninterest Income"),
+    ("BHCK4340", "Net Income"),
+)
+DEPOSIT_METRICS = (
+    ("BHDM6636", "Interest-bearing Deposits"),
+    ("BHCK4010", "Total Interest Income"),
+    ("BHCK4073", "Total Interest Expense"),
+)
+EXPENSE_METRICS = (
+    ("BHCK4093", "Total Noninterest Expense"),
+    ("BHCK4230", "Provision for Loan Losses"),
+)
+YOY_BALANCE_METRICS = (
+    ("BHCK2170", "Total Assets"),
+    ("BHCK3210", "Equity"),
+    ("BHCKB528", "Net Loans"),
+    ("BHDM6636", "Deposits"),
+)
+YOY_INCOME_METRICS = (
+    ("BHCK4074", "Net Interest Income"),
+    ("BHCK4079", "Noninterest Income"),
+    ("BHCK4093", "Noninterest Expense"),
+    ("BHCK4340", "Net Income"),
+)
+
+# Layout shared by every chart; each builder adds its title and chart-specific keys
+BASE_LAYOUT = dict(
+    yaxis_title="Value ($ Millions)",
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1
+    ),
+    margin=dict(l=60, r=40, t=80, b=60),
+    height=400,
+    template="plotly_white"
+)
 
 def get_db_connection():
-    """Get database connection."""
-    return sqlite3.connect(DB_PATH)
+    """Get a read-only database connection; the dashboard never writes."""
+    conn = sqlite3.connect(f"{Path(DB_PATH).resolve().as_uri()}?mode=ro", uri=True)
+    # Read pages straight from the OS page cache instead of copying them
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+def get_db_stamp():
+    """
+    Return (mtime_ns, size) of the database and its WAL file.
+
+    A missing or empty WAL counts as None; opening a read-only connection
+    can leave an empty one behind without anything having been written.
+    """
+    stamp = []
+    for path in (Path(DB_PATH), Path(f"{DB_PATH}-wal")):
+        try:
+            st = path.stat()
+        except OSError:
+            stamp.append(None)
+            continue
+        stamp.append((st.st_mtime_ns, st.st_size) if st.st_size else None)
+    return tuple(stamp)
+
+
+def read_with_duckdb(columns, table):
+    """
+    Read columns of a database table through DuckDB's sqlite scanner.
+
+    Returns None if DuckDB isn't installed or its sqlite extension can't be
+    loaded (it is downloaded on first use), so callers can fall back.
+    """
+    try:
+        import duckdb
+    except ImportError:
+        return None
+
+    try:
+        with duckdb.connect() as con:
+            con.execute("INSTALL sqlite; LOAD sqlite;")
+            return con.execute(f"SELECT {columns} FROM sqlite_scan(?, '{table}')", [str(DB_PATH)]).fetch_df()
+    except duckdb.Error:
+        return None
 
 
 def load_financial_data():
-    """Load all financial data from database."""
-    conn = get_db_connection()
-    query = """
-        SELECT fd.report_date, fd.year, fd.quarter, fd.mdrm_code, fd.value,
-               ad.account_name, ad.statement_type, ad.category
-        FROM financial_data fd
-        JOIN account_definitions ad ON fd.mdrm_code = ad.mdrm_code
-        ORDER BY fd.year, fd.quarter
     """
-    df = pd.read_sql_query(query, conn)
+    Load all financial data from database.
+
+    Reads the pre-joined financial_dashboard_mv table (rebuilt after each
+    data load), so no JOIN or ORDER BY runs at page load. A database without
+    that table is read through the financial_data x account_definitions join
+    it is built from.
+
+    Reads through the ADBC SQLite driver when it is installed, which returns
+    the result as a columnar Arrow table instead of building a Python tuple
+    per row; next tries DuckDB's sqlite scanner, which is vectorized in the
+    same way; otherwise falls back to pandas over sqlite3.
+    """
+    conn = get_db_connection()
+    has_view = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'financial_dashboard_mv'"
+    ).fetchone() is not None
     conn.close()
-    return df
+
+    columns = "report_date, year, quarter, mdrm_code, value"
+    if has_view:
+        source = "financial_dashboard_mv"
+    else:
+        source = """(
+            SELECT fd.report_date, fd.year, fd.quarter, fd.mdrm_code, fd.value
+            FROM financial_data fd
+            JOIN account_definitions ad ON fd.mdrm_code = ad.mdrm_code
+            ORDER BY fd.year, fd.quarter
+        )"""
+    query = f"""
+        SELECT {columns}
+        FROM {source}
+    """
+
+    try:
+        import adbc_driver_sqlite.dbapi as adbc_sqlite
+    except ImportError:
+        adbc_sqlite = None
+
+    if adbc_sqlite is not None:
+        with adbc_sqlite.connect(str(DB_PATH)) as conn, conn.cursor() as cursor:
+            cursor.execute(query)
+            df = cursor.fetch_arrow_table().to_pandas()
+    elif has_view:
+        df = read_with_duckdb(columns, "financial_dashboard_mv")
+    else:
+        df = None
+
+    if df is None:
+        conn = get_db_connection()
+        df = pd.read_sql_query(query, conn)
+        conn.close()
+
+    return compact_dtypes(df)
 
 
 def generate_sample_historical_data():
@@ -54,46 +207,76 @@ def generate_sample_historical_data():
     }
 
     # Generate 20 quarters of historical data (2021 Q1 to 2025 Q4)
-    quarters = []
-    for year in [2021, 2022, 2023, 2024, 2025]:
-        for q in [1, 2, 3, 4]:
-            quarter_end = {1: "03-31", 2: "06-30", 3: "09-30", 4: "12-31"}[q]
-            quarters.append({
-                "year": year,
-                "quarter": q,
-                "report_date": f"{year}-{quarter_end}"
-            })
-
-    data_rows = []
-    np.random.seed(42)  # Reproducible randomness
-
-    total_quarters = len(quarters)
-    for metric, info in metrics.items():
-        for i, qtr in enumerate(quarters):
-            # Create growth trend with some seasonal variation
-            quarter_idx = i
-            trend = 1 + (0.02 * quarter_idx)  # ~2% quarterly growth
-            seasonal = 1 + 0.03 * np.sin(2 * np.pi * qtr["quarter"] / 4)  # Seasonal variation
-            noise = 1 + np.random.normal(0, 0.02)  # Random noise
-
-            # Expense items grow differently
-            if "expense" in info["category"].lower() or "provision" in info["category"].lower():
-                trend = 1 + (0.015 * quarter_idx)  # Slightly slower growth
-
-            value = info["base"] * trend * seasonal * noise / (1 + 0.02 * (total_quarters - 1))  # Normalize so last quarter matches base
-
-            data_rows.append({
-                "report_date": qtr["report_date"],
-                "year": qtr["year"],
-                "quarter": qtr["quarter"],
-                "mdrm_code": metric,
-                "account_name": info["name"],
-                "statement_type": info["statement"],
-                "category": info["category"],
-                "value": value
-            })
-
-    return pd.DataFrame(data_rows)
+    quarter_ends = {1: "03-31", 2: "06-30", 3: "09-30", 4: "12-31"}
+    years = np.repeat([2021, 2022, 2023, 2024, 2025], 4)
+    quarter_nums = np.tile([1, 2, 3, 4], 5)
+    report_dates = [f"{year}-{quarter_ends[q]}" for year, q in zip(years, quarter_nums)]
+
+    infos = list(metrics.values())
+    n_metrics = len(infos)
+    total_quarters = len(years)
+
+    # Expense items grow differently (~1.5% vs ~2% quarterly growth)
+    base = np.array([info["base"] for info in infos], dtype=float)
+    is_expense = np.array([
+        "expense" in info["category"].lower() or "provision" in info["category"].lower()
+        for info in infos
+    ])
+    growth = np.where(is_expense, 0.015, 0.02)
+
+    # Whole (metric x quarter) grid at once: growth trend, seasonal variation, random noise
+    rng = np.random.default_rng(42)  # Reproducible randomness
+    quarter_idx = np.arange(total_quarters)
+    trend = 1 + growth[:, None] * quarter_idx
+    seasonal = 1 + 0.03 * np.sin(2 * np.pi * quarter_nums / 4)
+    noise = 1 + rng.normal(0, 0.02, size=(n_metrics, total_quarters))
+
+    # Normalize so last quarter matches base
+    values = base[:, None] * trend * seasonal * noise / (1 + 0.02 * (total_quarters - 1))
+
+    return compact_dtypes(pd.DataFrame({
+        "report_date": np.tile(report_dates, n_metrics),
+        "year": np.tile(years, n_metrics),
+        "quarter": np.tile(quarter_nums, n_metrics),
+        "mdrm_code": np.repeat(list(metrics.keys()), total_quarters),
+        "value": values.ravel(),
+    }))
+
+
+def compact_dtypes(df):
+    """
+    Shrink the loaded frame's dtypes in place.
+
+    mdrm_code holds a few dozen distinct values across every row, so it is
+    stored as a categorical (small integer codes); year and quarter fit in
+    int16/int8 and report_date is parsed once into datetime64.
+    """
+    df["mdrm_code"] = df["mdrm_code"].astype("category")
+    df["year"] = df["year"].astype("int16")
+    df["quarter"] = df["quarter"].astype("int8")
+    df["report_date"] = pd.to_datetime(df["report_date"])
+    return df
+
+
+def downsample_minmax(x, y, max_points=MAX_CHART_POINTS):
+    """
+    Reduce a series to at most max_points points for plotting.
+
+    Splits the series into equal buckets and keeps each bucket's minimum and
+    maximum, so peaks and troughs survive and the rendered line looks the same
+    at screen resolution. Series already within the limit are returned as-is.
+    """
+    if len(y) <= max_points:
+        return x, y
+
+    edges = np.linspace(0, len(y), max_points // 2 + 1, dtype=int)
+    keep = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        segment = y[start:end]
+        keep.extend(sorted({start + int(np.argmin(segment)), start + int(np.argmax(segment))}))
+
+    keep = np.asarray(keep)
+    return x[keep], y[keep]
 
 
 def get_quarter_data(df, year, quarter):
@@ -101,9 +284,32 @@ def get_quarter_data(df, year, quarter):
     return df[(df["year"] == year) & (df["quarter"] == quarter)]
 
 
+def quarter_labels(df):
+    """Return "2023 Q4"-style period labels for every row of df."""
+    return df["year"].astype(str) + " Q" + df["quarter"].astype(str)
+
+
+def get_metric_series(df):
+    """Map each MDRM code to (quarter labels, values in $ millions) for its reported periods, in period order."""
+    df = df.sort_values(["year", "quarter"])
+    return {
+        mdrm: (quarter_labels(sub).to_numpy(), sub["value"].to_numpy() / 1e6)
+        for mdrm, sub in df.groupby("mdrm_code", observed=True)
+    }
+
+
+def get_quarter_values_m(mdrms, year, quarter):
+    """Return one quarter's values in $ millions for each MDRM code, 0 where not reported."""
+    col = QUARTER_IX.get((year, quarter))
+    if col is None:
+        return np.zeros(len(mdrms))
+    rows = np.array([MDRM_IX.get(mdrm, -1) for mdrm in mdrms])
+    return np.nan_to_num(np.where(rows >= 0, VALUES_M[rows, col], np.nan))
+
+
 def get_prior_year_quarter_data(df, year, quarter):
     """Get data for same quarter in prior year."""
-    return df[(df["year"] == year - 1) & (df["quarter"] == quarter)]
+    return get_quarter_data(df, year - 1, quarter)
 
 
 def format_value(value, format_type="currency"):
@@ -124,126 +330,139 @@ def format_value(value, format_type="currency"):
     return str(value)
 
 
-def calculate_yoy_change(current, prior):
-    """Calculate year-over-year percentage change."""
-    if prior == 0 or pd.isna(prior) or pd.isna(current) or prior is None or current is None:
-        return None
-    return ((current - prior) / abs(prior)) * 100
-
-
-def create_summary_stats(df, selected_year, selected_quarter):
-    """Create summary statistics with Y-o-Y comparisons for selected quarter."""
-    current_data = get_quarter_data(df, selected_year, selected_quarter)
-    prior_year_data = get_prior_year_quarter_data(df, selected_year, selected_quarter)
+def format_values(values):
+    """Currency-format an array of values like format_value, picking every unit tier in one np.select."""
+    values = np.asarray(values, dtype=float)
+    magnitude = np.abs(values)
+    tiers = [magnitude >= 1e9, magnitude >= 1e6, magnitude >= 1e3]
+    scaled = values / np.select(tiers, [1e9, 1e6, 1e3], default=1.0)
+    templates = np.select(tiers, ["${:.2f}B", "${:.1f}M", "${:.1f}K"], default="${:,.0f}")
+    return ["N/A" if np.isnan(v) else t.format(s) for v, s, t in zip(values, scaled, templates)]
 
-    # Key metrics to display
-    key_metrics = [
-        ("BHCK2170", "Total Assets"),
-        ("BHCK3210", "Total Equity"),
-        ("BHCKB528", "Net Loans"),
-        ("BHCK4074", "Net Interest Income"),
-        ("BHCK4340", "Net Income"),
-        ("BHCK4079", "Noninterest Income"),
-    ]
 
-    stats = []
-    for mdrm, name in key_metrics:
-        current_val = current_data[current_data["mdrm_code"] == mdrm]["value"].values
-        prior_val = prior_year_data[prior_year_data["mdrm_code"] == mdrm]["value"].values if len(prior_year_data) > 0 else []
-
-        current = current_val[0] if len(current_val) > 0 else None
-        prior = prior_val[0] if len(prior_val) > 0 else None
-
-        yoy = calculate_yoy_change(current, prior)
+def create_summary_stats(selected_year, selected_quarter):
+    """
+    Create summary statistics with Y-o-Y comparisons for selected quarter.
 
-        stats.append({
-            "metric": name,
-            "current": current,
-            "prior": prior,
-            "yoy": yoy
-        })
+    Reads the PIVOT and YOY_PCT matrices built by build_lookup_caches.
+    Returns (names, current, yoy) where current and yoy are float arrays
+    aligned with KEY_METRICS; missing values are NaN.
+    """
+    names = [name for _, name in KEY_METRICS]
+    codes = [mdrm for mdrm, _ in KEY_METRICS]
+    key = [(selected_year, selected_quarter)]
+
+    current = PIVOT.reindex(index=key, columns=codes).to_numpy(dtype=float)[0]
+    yoy = YOY_PCT.reindex(index=key, columns=codes).to_numpy(dtype=float)[0]
+
+    return names, current, yoy
+
+
+def set_selected_marker(fig, selected_year, selected_quarter):
+    """Add or move the dashed "Selected" line on a trend chart, hiding it if the quarter isn't plotted."""
+    x_labels = fig.layout.xaxis.categoryarray or ()
+    label_idx = {label: i for i, label in enumerate(x_labels)}
+    selected_idx = label_idx.get(f"{selected_year} Q{selected_quarter}")
+
+    if selected_idx is None:
+        for shape in fig.layout.shapes:
+            shape.visible = False
+        for annotation in fig.layout.annotations:
+            annotation.visible = False
+        return fig
+
+    # Shapes on a categorical x-axis are positioned by category index
+    if fig.layout.shapes:
+        fig.layout.shapes[0].update(x0=selected_idx, x1=selected_idx, visible=True)
+        fig.layout.annotations[0].update(x=selected_idx, visible=True)
+        return fig
+
+    fig.add_shape(
+        type="line",
+        x0=selected_idx, x1=selected_idx,
+        y0=0, y1=1,
+        yref="paper",
+        line=dict(color="red", width=2, dash="dash")
+    )
+    fig.add_annotation(
+        x=selected_idx, y=1.05,
+        yref="paper",
+        text="Selected",
+        showarrow=False,
+        font=dict(color="red", size=10)
+    )
+    return fig
 
-    return stats
 
+def create_timeseries_chart(df, metrics, title, selected_year, selected_quarter, by_code=None):
+    """
+    Create a timeseries chart for given metrics with selected quarter highlighted.
 
-def create_timeseries_chart(df, metrics, title, selected_year, selected_quarter):
-    """Create a timeseries chart for given metrics with selected quarter highlighted."""
+    by_code maps MDRM codes to series as get_metric_series(df) does, and is
+    built from df when not given.
+    """
     fig = go.Figure()
 
     colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#3B1F2B', '#95C623']
-    x_labels = []
+
+    # The quarter grid is shared by every metric, so build the axis labels once
+    all_quarters = sorted(df[["year", "quarter"]].drop_duplicates().itertuples(index=False))
+    x_labels = [f"{year} Q{quarter}" for year, quarter in all_quarters]
+    fig.update_xaxes(type="category", categoryorder="array", categoryarray=x_labels)
+
+    if by_code is None:
+        by_code = get_metric_series(df)
 
     for i, (mdrm, name) in enumerate(metrics):
-        metric_data = df[df["mdrm_code"] == mdrm].sort_values(["year", "quarter"])
+        series = by_code.get(mdrm)
 
-        if len(metric_data) > 0:
-            # Create x-axis labels like "2023 Q4"
-            x_labels = [f"{row['year']} Q{row['quarter']}" for _, row in metric_data.iterrows()]
+        if series is not None and len(series[0]) > 0:
+            # x-axis labels like "2023 Q4", precomputed at load time
+            metric_labels, metric_values = series
+            # Values are already in millions; cap the point count for very long histories
+            x_values, y_values = downsample_minmax(metric_labels, metric_values)
 
-            fig.add_trace(go.Scatter(
-                x=x_labels,
-                y=metric_data["value"] / 1e6,  # Convert to millions
+            fig.add_trace(go.Scattergl(
+                x=x_values.tolist(),
+                y=y_values,
                 mode='lines+markers',
                 name=name,
                 line=dict(color=colors[i % len(colors)], width=2),
                 marker=dict(size=6)
             ))
 
-    # Add vertical line for selected quarter using shape (works with categorical x-axis)
-    selected_label = f"{selected_year} Q{selected_quarter}"
-    if selected_label in x_labels:
-        selected_idx = x_labels.index(selected_label)
-        fig.add_shape(
-            type="line",
-            x0=selected_idx, x1=selected_idx,
-            y0=0, y1=1,
-            yref="paper",
-            line=dict(color="red", width=2, dash="dash")
-        )
-        fig.add_annotation(
-            x=selected_idx, y=1.05,
-            yref="paper",
-            text="Selected",
-            showarrow=False,
-            font=dict(color="red", size=10)
-        )
+    set_selected_marker(fig, selected_year, selected_quarter)
 
     fig.update_layout(
         title=dict(text=title, font=dict(size=16)),
         xaxis_title="Quarter",
-        yaxis_title="Value ($ Millions)",
         hovermode='x unified',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        margin=dict(l=60, r=40, t=80, b=60),
-        height=400,
-        template="plotly_white"
+        **BASE_LAYOUT
     )
 
     return fig
 
 
-def create_bar_chart_yoy(df, metrics, title, selected_year, selected_quarter):
-    """Create a bar chart comparing selected quarter vs prior year."""
-    current_data = get_quarter_data(df, selected_year, selected_quarter)
-    prior_year_data = get_prior_year_quarter_data(df, selected_year, selected_quarter)
+def get_yoy_bar_values(metrics, selected_year, selected_quarter):
+    """Return (names, current_vals, prior_vals) in $ millions for a Y-o-Y bar chart."""
+    names = [name for _, name in metrics]
+    mdrms = [mdrm for mdrm, _ in metrics]
+    current_vals = get_quarter_values_m(mdrms, selected_year, selected_quarter)
+    prior_vals = get_quarter_values_m(mdrms, selected_year - 1, selected_quarter)
+    return names, current_vals, prior_vals
 
-    names = []
-    current_vals = []
-    prior_vals = []
 
-    for mdrm, name in metrics:
-        current = current_data[current_data["mdrm_code"] == mdrm]["value"].values
-        prior = prior_year_data[prior_year_data["mdrm_code"] == mdrm]["value"].values if len(prior_year_data) > 0 else []
+def update_bar_chart_yoy(fig, metrics, selected_year, selected_quarter):
+    """Point an existing Y-o-Y bar chart at a new quarter by replacing its trace values."""
+    _, current_vals, prior_vals = get_yoy_bar_values(metrics, selected_year, selected_quarter)
+    fig.data[0].update(name=f'{selected_year - 1} Q{selected_quarter}', y=prior_vals)
+    fig.data[1].update(name=f'{selected_year} Q{selected_quarter}', y=current_vals)
+    return fig
 
-        names.append(name)
-        current_vals.append(current[0] / 1e6 if len(current) > 0 else 0)
-        prior_vals.append(prior[0] / 1e6 if len(prior) > 0 else 0)
+
+def create_bar_chart_yoy(metrics, title, selected_year, selected_quarter):
+    """Create a bar chart comparing selected quarter vs prior year, from the cached VALUES_M matrix."""
+    names, current_vals, prior_vals = get_yoy_bar_values(metrics, selected_year, selected_quarter)
 
     fig = go.Figure()
 
@@ -251,95 +470,158 @@ def create_bar_chart_yoy(df, metrics, title, selected_year, selected_quarter):
         name=f'{selected_year - 1} Q{selected_quarter}',
         x=names,
         y=prior_vals,
-        marker_color='#A0A0A0'
+        marker_color='#A0A0A0',
+        cliponaxis=False
     ))
 
     fig.add_trace(go.Bar(
         name=f'{selected_year} Q{selected_quarter}',
         x=names,
         y=current_vals,
-        marker_color='#2E86AB'
+        marker_color='#2E86AB',
+        cliponaxis=False
     ))
 
     fig.update_layout(
         title=dict(text=title, font=dict(size=16)),
-        yaxis_title="Value ($ Millions)",
         barmode='group',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        margin=dict(l=60, r=40, t=80, b=60),
-        height=400,
-        template="plotly_white"
+        **BASE_LAYOUT
     )
 
     return fig
 
 
-def create_summary_html(stats):
-    """Create HTML for summary stats cards."""
-    html_parts = []
+def create_summary_html(names, current, yoy):
+    """Create HTML for summary stats cards from the arrays returned by create_summary_stats."""
+    values = format_values(current)
+    cards = []
+    for i, name in enumerate(names):
+        cards.append(SUMMARY_CARD_TEMPLATE.format(
+            border=SUMMARY_CARD_BORDERS[i // 3],
+            name=name,
+            value=values[i],
+            color="green" if yoy[i] > 0 else "red" if yoy[i] < 0 else "gray",
+            yoy=f"{yoy[i]:+.1f}% Y-o-Y" if np.isfinite(yoy[i]) and yoy[i] else "N/A",
+        ))
+
+    # Two rows of three cards
+    return (
+        '<div style="display: flex; gap: 15px; margin-bottom: 15px;">' + ''.join(cards[:3]) + '</div>'
+        '<div style="display: flex; gap: 15px;">' + ''.join(cards[3:6]) + '</div>'
+    )
 
-    # First row (3 cards)
-    html_parts.append('<div style="display: flex; gap: 15px; margin-bottom: 15px;">')
-    for stat in stats[:3]:
-        yoy_text = f"{stat['yoy']:+.1f}% Y-o-Y" if stat['yoy'] else "N/A"
-        yoy_color = "green" if stat['yoy'] and stat['yoy'] > 0 else "red" if stat['yoy'] and stat['yoy'] < 0 else "gray"
 
-        html_parts.append(f'''
-            <div style="flex: 1; text-align: center; padding: 15px; background: #f8f9fa; border-radius: 8px; border-left: 4px solid #2E86AB;">
-                <div style="font-size: 14px; color: #666; margin-bottom: 5px;">{stat['metric']}</div>
-                <div style="font-size: 24px; font-weight: bold; color: #333;">{format_value(stat['current'])}</div>
-                <div style="font-size: 12px; color: {yoy_color}; margin-top: 5px;">{yoy_text}</div>
-            </div>
-        ''')
-    html_parts.append('</div>')
-
-    # Second row (3 cards)
-    html_parts.append('<div style="display: flex; gap: 15px;">')
-    for stat in stats[3:6]:
-        yoy_text = f"{stat['yoy']:+.1f}% Y-o-Y" if stat['yoy'] else "N/A"
-        yoy_color = "green" if stat['yoy'] and stat['yoy'] > 0 else "red" if stat['yoy'] and stat['yoy'] < 0 else "gray"
-
-        html_parts.append(f'''
-            <div style="flex: 1; text-align: center; padding: 15px; background: #f8f9fa; border-radius: 8px; border-left: 4px solid #A23B72;">
-                <div style="font-size: 14px; color: #666; margin-bottom: 5px;">{stat['metric']}</div>
-                <div style="font-size: 24px; font-weight: bold; color: #333;">{format_value(stat['current'])}</div>
-                <div style="font-size: 12px; color: {yoy_color}; margin-top: 5px;">{yoy_text}</div>
-            </div>
-        ''')
-    html_parts.append('</div>')
+# Global data storage, and the database path and stamp it was read at
+GLOBAL_DF = None
+GLOBAL_DF_KEY = None
 
-    return ''.join(html_parts)
+# Chart figures, built on the first update and then modified in place
+FIGS = {}
 
+# Lookups materialized from GLOBAL_DF once at load time
+MDRM_SERIES = {}
+QUARTER_CHOICES = []
+PIVOT = pd.DataFrame()
+YOY_PCT = pd.DataFrame()
+VALUES = np.empty((0, 0))
+VALUES_M = np.empty((0, 0))
+MDRM_IX = {}
+QUARTER_IX = {}
 
-# Global data storage
-GLOBAL_DF = None
+
+def build_lookup_caches(df):
+    """
+    Materialize dropdown choices, the (year, quarter) x mdrm value and Y-o-Y %
+    matrices, and the contiguous mdrm x quarter VALUES array the trend charts
+    slice.
+    """
+    global MDRM_SERIES, QUARTER_CHOICES, PIVOT, YOY_PCT
+    global VALUES, VALUES_M, MDRM_IX, QUARTER_IX
+
+    PIVOT = df.pivot_table(index=["year", "quarter"], columns="mdrm_code", values="value",
+                           aggfunc="last", observed=True).sort_index()
+    PIVOT.columns = PIVOT.columns.astype(str)
+    QUARTER_CHOICES = [f"{year} Q{quarter}" for year, quarter in reversed(PIVOT.index)]
+    # Align each row with the same quarter one year earlier (gaps stay NaN)
+    years = PIVOT.index.get_level_values("year")
+    prior = PIVOT.reindex(pd.MultiIndex.from_arrays([years - 1, PIVOT.index.get_level_values("quarter")]))
+    prior.index = PIVOT.index
+    YOY_PCT = ((PIVOT - prior) / prior.abs() * 100).mask(prior == 0)
+
+    # Row per MDRM code, column per quarter; NaN where a code wasn't reported
+    VALUES = np.ascontiguousarray(PIVOT.to_numpy(dtype=float).T)
+    VALUES_M = VALUES * 1e-6
+    MDRM_IX = {mdrm: i for i, mdrm in enumerate(PIVOT.columns)}
+    QUARTER_IX = {key: j for j, key in enumerate(PIVOT.index)}
+    labels = np.array([f"{year} Q{quarter}" for year, quarter in PIVOT.index])
+    reported = ~np.isnan(VALUES)
+    MDRM_SERIES = {mdrm: (labels[reported[i]], VALUES_M[i, reported[i]]) for mdrm, i in MDRM_IX.items()}
 
 
 def get_data():
-    """Get or load the global dataframe."""
-    global GLOBAL_DF
-    if GLOBAL_DF is None:
+    """
+    Get or load the global dataframe.
+
+    It is reloaded, with the lookup caches and figures built from it, when
+    get_db_stamp() shows the database has changed since it was read, so a
+    running dashboard picks up a loader run without a restart.
+    """
+    global GLOBAL_DF, GLOBAL_DF_KEY
+    key = (str(DB_PATH), get_db_stamp())
+    if GLOBAL_DF is None or key != GLOBAL_DF_KEY:
+        GLOBAL_DF_KEY = key
         try:
             GLOBAL_DF = load_financial_data()
             if len(GLOBAL_DF) == 0:
                 raise ValueError("No data in database")
-            unique_quarters = GLOBAL_DF.groupby(["year", "quarter"]).size().reset_index()
+            unique_quarters = GLOBAL_DF[["year", "quarter"]].drop_duplicates()
             if len(unique_quarters) <= 1:
                 GLOBAL_DF = generate_sample_historical_data()
         except Exception as e:
             print(f"Using sample data: {e}")
             GLOBAL_DF = generate_sample_historical_data()
+        build_lookup_caches(GLOBAL_DF)
+        FIGS.clear()
+        _compute_dashboard.cache_clear()
     return GLOBAL_DF
 
 
+def get_timeseries_figure(key, df, metrics, title, selected_year, selected_quarter):
+    """Return the cached trend figure for key, building it once and only moving its marker after."""
+    fig = FIGS.get(key)
+    if fig is None:
+        fig = FIGS[key] = create_timeseries_chart(df, metrics, title, selected_year, selected_quarter, MDRM_SERIES)
+    else:
+        set_selected_marker(fig, selected_year, selected_quarter)
+    return fig
+
+
+def get_yoy_figure(key, metrics, title, selected_year, selected_quarter):
+    """Return the cached Y-o-Y figure for key, building it once and only swapping bar values after."""
+    fig = FIGS.get(key)
+    if fig is None:
+        fig = FIGS[key] = create_bar_chart_yoy(metrics, title, selected_year, selected_quarter)
+    else:
+        update_bar_chart_yoy(fig, metrics, selected_year, selected_quarter)
+    return fig
+
+
 def update_dashboard(selected_quarter_str):
     """Update all dashboard components based on selected quarter."""
+    # Checked before the memoized build, which a database change invalidates
+    get_data()
+    return _compute_dashboard(selected_quarter_str)
+
+
+@functools.lru_cache(maxsize=64)
+def _compute_dashboard(selected_quarter_str):
+    """
+    Build the summary HTML and six figures for a quarter.
+
+    Memoized per quarter string since the data is fixed once loaded; get_data()
+    clears the cache on reload. The shared FIGS are modified in place on every
+    miss, so the cached tuple holds copies that later updates can't touch.
+    """
     df = get_data()
 
     # Parse selected quarter (e.g., "2025 Q4")
@@ -348,65 +630,32 @@ def update_dashboard(selected_quarter_str):
     selected_quarter = int(parts[1][1])  # Extract number from "Q4"
 
     # Create summary stats
-    stats = create_summary_stats(df, selected_year, selected_quarter)
-    summary_html = create_summary_html(stats)
+    names, current, yoy = create_summary_stats(selected_year, selected_quarter)
+    summary_html = create_summary_html(names, current, yoy)
 
     # Create charts
-    balance_metrics = [
-        ("BHCK2170", "Total Assets"),
-        ("BHCK3210", "Total Equity"),
-        ("BHCKB528", "Net Loans"),
-    ]
-    fig_balance = create_timeseries_chart(df, balance_metrics, "Balance Sheet Trends", selected_year, selected_quarter)
-
-    income_metrics = [
-        ("BHCK4074", "Net Interest Income"),
-        ("BHCK4079", "Noninterest Income"),
-        ("BHCK4340", "Net Income"),
-    ]
-    fig_income = create_timeseries_chart(df, income_metrics, "Income Statement Trends", selected_year, selected_quarter)
-
-    deposit_metrics = [
-        ("BHDM6636", "Interest-bearing Deposits"),
-        ("BHCK4010", "Total Interest Income"),
-        ("BHCK4073", "Total Interest Expense"),
-    ]
-    fig_deposits = create_timeseries_chart(df, deposit_metrics, "Interest Income & Expense Trends", selected_year, selected_quarter)
-
-    expense_metrics = [
-        ("BHCK4093", "Total Noninterest Expense"),
-        ("BHCK4230", "Provision for Loan Losses"),
-    ]
-    fig_expense = create_timeseries_chart(df, expense_metrics, "Expense Trends", selected_year, selected_quarter)
-
-    yoy_balance = [
-        ("BHCK2170", "Total Assets"),
-        ("BHCK3210", "Equity"),
-        ("BHCKB528", "Net Loans"),
-        ("BHDM6636", "Deposits"),
-    ]
-    fig_yoy_balance = create_bar_chart_yoy(df, yoy_balance, "Balance Sheet Y-o-Y Comparison", selected_year, selected_quarter)
-
-    yoy_income = [
-        ("BHCK4074", "Net Interest Income"),
-        ("BHCK4079", "Noninterest Income"),
-        ("BHCK4093", "Noninterest Expense"),
-        ("BHCK4340", "Net Income"),
-    ]
-    fig_yoy_income = create_bar_chart_yoy(df, yoy_income, "Income Statement Y-o-Y Comparison", selected_year, selected_quarter)
-
-    return summary_html, fig_balance, fig_income, fig_deposits, fig_expense, fig_yoy_balance, fig_yoy_income
+    fig_balance = get_timeseries_figure("balance", df, BALANCE_METRICS, "Balance Sheet Trends", selected_year, selected_quarter)
+    fig_income = get_timeseries_figure("income", df, INCOME_METRICS, "Income Statement Trends", selected_year, selected_quarter)
+    fig_deposits = get_timeseries_figure("deposits", df, DEPOSIT_METRICS, "Interest Income & Expense Trends", selected_year, selected_quarter)
+    fig_expense = get_timeseries_figure("expense", df, EXPENSE_METRICS, "Expense Trends", selected_year, selected_quarter)
+    fig_yoy_balance = get_yoy_figure("yoy_balance", YOY_BALANCE_METRICS, "Balance Sheet Y-o-Y Comparison", selected_year, selected_quarter)
+    fig_yoy_income = get_yoy_figure("yoy_income", YOY_INCOME_METRICS, "Income Statement Y-o-Y Comparison", selected_year, selected_quarter)
+
+    figures = (fig_balance, fig_income, fig_deposits, fig_expense, fig_yoy_balance, fig_yoy_income)
+    return (summary_html, *(go.Figure(fig) for fig in figures))
 
 
 def create_dashboard():
     """Create the Gradio dashboard interface."""
+    # Gradio is only needed for the UI; importing it lazily keeps the data
+    # and chart helpers importable without its start-up cost
+    import gradio as gr
+
     # Load data
-    df = get_data()
+    get_data()
 
     # Get available quarters
-    quarters_df = df.groupby(["year", "quarter"]).size().reset_index()
-    quarters_df = quarters_df.sort_values(["year", "quarter"], ascending=[False, False])
-    quarter_choices = [f"{row['year']} Q{row['quarter']}" for _, row in quarters_df.iterrows()]
+    quarter_choices = QUARTER_CHOICES
 
     # Default to latest quarter (2025 Q4)
     default_quarter = quarter_choices[0]  # Should be "2025 Q4"
@@ -1,5 +1,11 @@
 """Dashboard module for USAA Y-9C financial data visualization."""
 
-from .app import create_dashboard, launch_dashboard
-
 __all__ = ["create_dashboard", "launch_dashboard"]
+
+
+def __getattr__(name):
+    # Import .app (pandas, plotly) on first use rather than at package import
+    if name in __all__:
+        from . import app
+        return getattr(app, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
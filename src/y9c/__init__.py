@@ -17,12 +17,21 @@ from .config import (
 from .database import (
     initialize_database,
     get_connection,
+    close_database,
+    get_account_definitions,
+    batch_writes,
+    session,
+    bulk_load_mode,
     get_balance_sheet,
     get_income_statement,
     get_time_series,
+    get_time_series_table,
+    analytics_connection,
     get_all_periods,
     export_to_csv,
+    export_to_parquet,
     bulk_insert_financial_data,
+    refresh_dashboard_view,
 )
 
 from .loader import (
@@ -50,12 +59,21 @@ __all__ = [
     # Database
     "initialize_database",
     "get_connection",
+    "close_database",
+    "get_account_definitions",
+    "batch_writes",
+    "session",
+    "bulk_load_mode",
     "get_balance_sheet",
     "get_income_statement",
     "get_time_series",
+    "get_time_series_table",
+    "analytics_connection",
     "get_all_periods",
     "export_to_csv",
+    "export_to_parquet",
     "bulk_insert_financial_data",
+    "refresh_dashboard_view",
     # Loader
     "load_quarter",
     "load_all_data",
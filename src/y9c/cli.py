@@ -19,6 +19,7 @@ from .database import (
     get_income_statement,
     get_all_periods,
     export_to_csv,
+    get_loaded_quarters,
     DB_PATH,
 )
 from .downloader import download_all_y9c_data, check_existing_data
@@ -57,7 +58,8 @@ def quarterly_update():
     current_year = datetime.now().year
 
     print("\n[1/2] Checking for new data files...")
-    download_all_y9c_data(current_year - 1, current_year)
+    loaded_quarters = set(get_loaded_quarters())
+    download_all_y9c_data(current_year - 1, current_year, skip=loaded_quarters)
 
     print("\n[2/2] Loading new data...")
     new_records = incremental_update(USAA_HOLDING_COMPANY_RSSD)
@@ -8,6 +8,9 @@ This file defines the MDRM codes needed to build financial statements
 from FR Y-9C regulatory filings.
 """
 
+import functools
+from types import MappingProxyType
+
 # USAA Identifiers
 USAA_HOLDING_COMPANY_RSSD = "1447376"  # United Services Automobile Association (parent)
 USAA_FSB_RSSD = "619877"  # USAA Federal Savings Bank (subsidiary)
@@ -174,47 +177,41 @@ MEMORANDA_ITEMS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_all_mdrm_codes():
-    """Return a flat dictionary of all MDRM codes with their descriptions."""
-    all_codes = {}
-
-    for category, items in BALANCE_SHEET_ITEMS.items():
-        for code, description in items.items():
-            all_codes[code] = {
-                "description": description,
-                "statement": "balance_sheet",
-                "category": category,
-            }
-
-    for category, items in INCOME_STATEMENT_ITEMS.items():
-        for code, description in items.items():
-            all_codes[code] = {
-                "description": description,
-                "statement": "income_statement",
-                "category": category,
-            }
-
-    for category, items in INSURANCE_SCHEDULE_ITEMS.items():
-        for code, description in items.items():
-            all_codes[code] = {
-                "description": description,
-                "statement": "insurance_schedule",
-                "category": category,
-            }
-
-    for code, description in MEMORANDA_ITEMS.items():
-        all_codes[code] = {
-            "description": description,
-            "statement": "memoranda",
-            "category": "memoranda",
-        }
-
-    return all_codes
-
-
+    """
+    Return a flat, read-only mapping of all MDRM codes with their descriptions.
+
+    Built once from the item dictionaries above and cached; callers share the
+    same mapping, so the per-code dicts must not be modified.
+    """
+    balance_sheet = {
+        code: {"description": description, "statement": "balance_sheet", "category": category}
+        for category, items in BALANCE_SHEET_ITEMS.items()
+        for code, description in items.items()
+    }
+    income_statement = {
+        code: {"description": description, "statement": "income_statement", "category": category}
+        for category, items in INCOME_STATEMENT_ITEMS.items()
+        for code, description in items.items()
+    }
+    insurance_schedule = {
+        code: {"description": description, "statement": "insurance_schedule", "category": category}
+        for category, items in INSURANCE_SCHEDULE_ITEMS.items()
+        for code, description in items.items()
+    }
+    memoranda = {
+        code: {"description": description, "statement": "memoranda", "category": "memoranda"}
+        for code, description in MEMORANDA_ITEMS.items()
+    }
+
+    return MappingProxyType(balance_sheet | income_statement | insurance_schedule | memoranda)
+
+
+@functools.lru_cache(maxsize=None)
 def get_mdrm_codes_list():
-    """Return a list of all MDRM codes for filtering raw data."""
-    return list(get_all_mdrm_codes().keys())
+    """Return a tuple of all MDRM codes for filtering raw data."""
+    return tuple(get_all_mdrm_codes())
 
 
 if __name__ == "__main__":
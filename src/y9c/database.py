@@ -8,9 +8,18 @@ Database Schema:
 - account_definitions: MDRM codes and their descriptions
 - financial_data: Actual financial data values
 - load_history: Track data loads for incremental updates
+- financial_dashboard_mv: Pre-joined financial_data rows read by the dashboard
 """
 
+import contextlib
+import csv
+import functools
+import itertools
+import shutil
 import sqlite3
+import subprocess
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
@@ -20,14 +29,148 @@ from .config import get_all_mdrm_codes, USAA_HOLDING_COMPANY_RSSD
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "usaa_y9c.db"
 
 
+# One connection per thread, opened on first use and reused by every helper
+_thread_local = threading.local()
+
+
 def get_connection():
-    """Get a database connection."""
+    """
+    Get this thread's shared database connection.
+
+    The connection is opened on first use and reused by later calls, so
+    helpers must not close it; it is reopened if DB_PATH changes. Call
+    close_database() to release it.
+    """
+    conn = getattr(_thread_local, "conn", None)
+    if conn is not None and _thread_local.path == DB_PATH:
+        return conn
+    if conn is not None:
+        conn.close()
+
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    apply_connection_pragmas(conn)
+    _thread_local.conn = conn
+    _thread_local.path = DB_PATH
     return conn
 
 
+def close_database():
+    """Close this thread's shared database connection, if open."""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _thread_local.conn = None
+
+
+def _tuple_cursor(conn):
+    """
+    Return a cursor on conn that yields plain tuples instead of sqlite3.Row.
+
+    Lets helpers hand fetchall() results straight back (or to dict()) without
+    a per-row Python rebuild.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+
+@contextlib.contextmanager
+def batch_writes():
+    """
+    Group several writes into a single transaction.
+
+    Yields the shared connection. Write helpers given it as conn= skip their
+    own commit and let errors propagate; the block commits once on exit, or
+    rolls back everything if it raises.
+    """
+    conn = get_connection()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+@contextlib.contextmanager
+def session():
+    """
+    Run several reads against one consistent snapshot of the database.
+
+    Yields the shared connection inside a read transaction, so a batch of
+    get_* calls (each given conn=) sees the same data even while the loader
+    commits. Inside an open batch_writes() block it just yields the
+    connection.
+    """
+    conn = get_connection()
+    if conn.in_transaction:
+        yield conn
+        return
+
+    conn.execute("BEGIN")
+    try:
+        yield conn
+    finally:
+        conn.commit()
+
+
+def apply_connection_pragmas(conn):
+    """
+    Tune a newly opened connection; run once per connection by get_connection().
+
+    WAL lets the dashboard read while the loader writes and needs the
+    database on a local filesystem (not a network share). synchronous=NORMAL
+    is safe under WAL (a crash can lose the last commit, never corrupt the
+    file) and avoids an fsync on every commit.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+
+
+# Secondary indexes on financial_data: name -> indexed columns
+FINANCIAL_DATA_INDEXES = {
+    # Covers get_all_periods, and any rssd_id lookup via its leading column
+    'idx_financial_data_rssd_period': 'rssd_id, year, quarter, report_date',
+    'idx_financial_data_date': 'report_date',
+    'idx_financial_data_year_quarter': 'year, quarter',
+    'idx_financial_data_mdrm_year_quarter': 'mdrm_code, year, quarter',
+}
+
+
+# Values are reported in thousands of whole dollars, so they are stored as
+# INTEGER (a compact varint in SQLite) rather than 8-byte REAL
+FINANCIAL_DATA_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS financial_data (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        rssd_id TEXT NOT NULL,
+        report_date DATE NOT NULL,
+        year INTEGER NOT NULL,
+        quarter INTEGER NOT NULL,
+        mdrm_code TEXT NOT NULL,
+        value INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(rssd_id, report_date, mdrm_code),
+        FOREIGN KEY (mdrm_code) REFERENCES account_definitions(mdrm_code)
+    )
+"""
+
+
+# Rows of the financial_dashboard_mv roll-up table
+DASHBOARD_VIEW_SELECT_SQL = """
+    SELECT fd.report_date, fd.year, fd.quarter, fd.mdrm_code,
+           CAST(fd.value AS REAL) AS value,
+           ad.account_name, ad.statement_type, ad.category
+    FROM financial_data fd
+    JOIN account_definitions ad ON fd.mdrm_code = ad.mdrm_code
+    ORDER BY fd.year, fd.quarter
+"""
+
+
 def create_schema():
     """Create the database schema."""
     conn = get_connection()
@@ -58,20 +201,8 @@ def create_schema():
         )
     """)
 
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS financial_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            rssd_id TEXT NOT NULL,
-            report_date DATE NOT NULL,
-            year INTEGER NOT NULL,
-            quarter INTEGER NOT NULL,
-            mdrm_code TEXT NOT NULL,
-            value REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(rssd_id, report_date, mdrm_code),
-            FOREIGN KEY (mdrm_code) REFERENCES account_definitions(mdrm_code)
-        )
-    """)
+    cursor.execute(FINANCIAL_DATA_TABLE_SQL)
+    migrate_value_to_integer(conn)
 
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS load_history (
@@ -86,53 +217,147 @@ def create_schema():
         )
     """)
 
-    # Create indexes
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_financial_data_rssd
-        ON financial_data(rssd_id)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_financial_data_date
-        ON financial_data(report_date)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_financial_data_mdrm
-        ON financial_data(mdrm_code)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_financial_data_year_quarter
-        ON financial_data(year, quarter)
-    """)
+    # Superseded by indexes sharing their leading column
+    cursor.execute("DROP INDEX IF EXISTS idx_financial_data_rssd")
+    cursor.execute("DROP INDEX IF EXISTS idx_financial_data_mdrm")
+    create_financial_data_indexes(conn)
+
+    # Built from whatever data is already present; refresh_dashboard_view
+    # rebuilds it after each load
+    cursor.execute(f"CREATE TABLE IF NOT EXISTS financial_dashboard_mv AS {DASHBOARD_VIEW_SELECT_SQL}")
 
     conn.commit()
-    conn.close()
     print("Database schema created successfully.")
 
 
+def migrate_value_to_integer(conn):
+    """
+    Rebuild a financial_data table created with a REAL value column.
+
+    SQLite cannot change a column's type in place, so the table is renamed,
+    recreated from FINANCIAL_DATA_TABLE_SQL and copied across. Its indexes go
+    with the old table; create_schema recreates them afterwards.
+    """
+    columns = {row['name']: row['type'] for row in conn.execute("PRAGMA table_info(financial_data)")}
+    if columns.get('value') != 'REAL':
+        return
+
+    conn.execute("ALTER TABLE financial_data RENAME TO financial_data_old")
+    conn.execute(FINANCIAL_DATA_TABLE_SQL)
+    conn.execute("""
+        INSERT INTO financial_data
+        (id, rssd_id, report_date, year, quarter, mdrm_code, value, created_at)
+        SELECT id, rssd_id, report_date, year, quarter, mdrm_code,
+               CAST(ROUND(value) AS INTEGER), created_at
+        FROM financial_data_old
+    """)
+    conn.execute("DROP TABLE financial_data_old")
+    conn.commit()
+    print("Migrated financial_data.value to INTEGER.")
+
+
+def create_financial_data_indexes(conn):
+    """Create the secondary indexes on financial_data."""
+    for name, columns in FINANCIAL_DATA_INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON financial_data({columns})")
+
+
+@contextlib.contextmanager
+def bulk_load_mode(conn=None):
+    """
+    Drop the secondary financial_data indexes for the duration of a bulk load.
+
+    Each insert otherwise has to update every index; rebuilding them once at
+    the end is much cheaper for a full restore. The UNIQUE constraint's index
+    stays in place so upserts keep their conflict target. If the load raises,
+    its uncommitted writes are rolled back before the indexes are rebuilt; a
+    process killed mid-load leaves them dropped until the next
+    create_financial_data_indexes() (create_schema, or a load_all_data run
+    that inserts with indexes in place).
+    """
+    if conn is None:
+        conn = get_connection()
+
+    # sqlite3 doesn't open a transaction for DDL itself; drop all or none
+    conn.execute("BEGIN")
+    try:
+        for name in FINANCIAL_DATA_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        create_financial_data_indexes(conn)
+        conn.commit()
+
+
+def has_financial_data(conn=None):
+    """Whether financial_data holds any rows."""
+    if conn is None:
+        conn = get_connection()
+    return conn.execute("SELECT EXISTS (SELECT 1 FROM financial_data)").fetchone()[0] == 1
+
+
 def populate_account_definitions():
     """Populate the account_definitions table with MDRM codes."""
     conn = get_connection()
     cursor = conn.cursor()
 
     all_codes = get_all_mdrm_codes()
+    params = [value for mdrm_code, info in all_codes.items()
+              for value in (mdrm_code, info["description"], info["statement"], info["category"])]
 
+    # The code list is fixed, so write every row with one multi-row statement
+    values = ", ".join(["(?, ?, ?, ?)"] * len(all_codes))
     insert_count = 0
-    for mdrm_code, info in all_codes.items():
-        try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO account_definitions
-                (mdrm_code, account_name, statement_type, category)
-                VALUES (?, ?, ?, ?)
-            """, (mdrm_code, info["description"], info["statement"], info["category"]))
-            insert_count += 1
-        except sqlite3.Error as e:
-            print(f"Error inserting {mdrm_code}: {e}")
+    try:
+        cursor.execute(f"""
+            INSERT OR REPLACE INTO account_definitions
+            (mdrm_code, account_name, statement_type, category)
+            VALUES {values}
+        """, params)
+        insert_count = len(all_codes)
+    except sqlite3.Error as e:
+        print(f"Error inserting account definitions: {e}")
 
     conn.commit()
-    conn.close()
+    _load_account_definitions.cache_clear()
     print(f"Populated {insert_count} account definitions.")
 
 
+@functools.lru_cache(maxsize=None)
+def _load_account_definitions(db_path):
+    """Read account_definitions from the database at db_path."""
+    cursor = _tuple_cursor(get_connection())
+    cursor.execute("""
+        SELECT mdrm_code, account_name, statement_type, category
+        FROM account_definitions
+    """)
+    return {row[0]: row[1:] for row in cursor.fetchall()}
+
+
+def get_account_definitions():
+    """
+    Get the account definitions as {mdrm_code: (account_name, statement_type, category)}.
+
+    The table is small and static, so it is read once per database and the
+    lookups below resolve names in Python instead of joining on every query.
+    """
+    return _load_account_definitions(str(DB_PATH))
+
+
+def _in_placeholders(count):
+    """Return '?, ?, ...' with count placeholders for an IN list."""
+    return ", ".join("?" * count)
+
+
 def add_institution(rssd_id, name, city=None, state=None, entity_type=None,
                     primary_regulator=None, parent_rssd_id=None):
     """Add or update an institution."""
@@ -140,190 +365,398 @@ def add_institution(rssd_id, name, city=None, state=None, entity_type=None,
     cursor = conn.cursor()
 
     cursor.execute("""
-        INSERT OR REPLACE INTO institutions
+        INSERT INTO institutions
         (rssd_id, name, city, state, entity_type, primary_regulator, parent_rssd_id, updated_at)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(rssd_id) DO UPDATE SET
+            name = excluded.name,
+            city = excluded.city,
+            state = excluded.state,
+            entity_type = excluded.entity_type,
+            primary_regulator = excluded.primary_regulator,
+            parent_rssd_id = excluded.parent_rssd_id,
+            updated_at = excluded.updated_at
     """, (rssd_id, name, city, state, entity_type, primary_regulator, parent_rssd_id,
           datetime.now()))
 
     conn.commit()
-    conn.close()
 
 
-def insert_financial_data(rssd_id, report_date, mdrm_code, value, year, quarter):
-    """Insert a single financial data record."""
+# Rows per commit in bulk_insert_financial_data
+BULK_INSERT_BATCH_SIZE = 10000
+
+# Rows per multi-row INSERT statement; at 6 parameters a row this stays well
+# under SQLite's bound-parameter limit
+MULTI_ROW_INSERT_ROWS = 500
+
+# Upsert updates the existing row in place (INSERT OR REPLACE would delete and
+# reinsert it, touching every index) and skips rows whose value is unchanged
+INSERT_FINANCIAL_DATA_SQL = """
+    INSERT INTO financial_data
+    (rssd_id, report_date, year, quarter, mdrm_code, value)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(rssd_id, report_date, mdrm_code) DO UPDATE SET value = excluded.value
+    WHERE financial_data.value IS NOT excluded.value
+"""
+
+
+def insert_financial_data(rssd_id, report_date, mdrm_code, value, year, quarter, conn=None):
+    """Insert a single financial data record; pass conn from batch_writes() to defer the commit."""
+    if conn is not None:
+        conn.execute(INSERT_FINANCIAL_DATA_SQL, (rssd_id, report_date, year, quarter, mdrm_code, value))
+        return
+
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
-        cursor.execute("""
-            INSERT OR REPLACE INTO financial_data
-            (rssd_id, report_date, year, quarter, mdrm_code, value)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (rssd_id, report_date, year, quarter, mdrm_code, value))
+        cursor.execute(INSERT_FINANCIAL_DATA_SQL, (rssd_id, report_date, year, quarter, mdrm_code, value))
         conn.commit()
     except sqlite3.Error as e:
+        conn.rollback()
         print(f"Error inserting data: {e}")
-    finally:
-        conn.close()
 
 
-def bulk_insert_financial_data(data_records):
+@functools.lru_cache(maxsize=None)
+def _multi_row_insert_sql(row_count):
+    """INSERT_FINANCIAL_DATA_SQL with row_count VALUES tuples, built once per count."""
+    values = ", ".join(["(?, ?, ?, ?, ?, ?)"] * row_count)
+    return INSERT_FINANCIAL_DATA_SQL.replace("VALUES (?, ?, ?, ?, ?, ?)", f"VALUES {values}")
+
+
+def _batched(iterable, size):
+    """Yield tuples of up to size items (itertools.batched from Python 3.12)."""
+    iterator = iter(iterable)
+    while chunk := tuple(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def bulk_insert_financial_data(data_records, conn=None, batch_size=BULK_INSERT_BATCH_SIZE):
     """
-    Bulk insert financial data records.
+    Bulk insert financial data records in chunks of batch_size rows.
+
+    Each chunk is committed on its own, so memory and transaction length stay
+    bounded however many rows are streamed in. Within a chunk rows are sent
+    MULTI_ROW_INSERT_ROWS at a time as one multi-row INSERT, which SQLite
+    runs faster than the same rows through executemany.
 
     Args:
-        data_records: List of tuples (rssd_id, report_date, year, quarter, mdrm_code, value)
+        data_records: Iterable of tuples (rssd_id, report_date, year, quarter, mdrm_code, value)
+        conn: Connection from batch_writes(); the caller then owns the commit
+        batch_size: Rows per commit
 
     Returns:
         Number of records inserted
     """
-    conn = get_connection()
+    owns_transaction = conn is None
+    if owns_transaction:
+        conn = get_connection()
     cursor = conn.cursor()
+    inserted = 0
+    # Time spent in SQLite only, not in producing data_records
+    elapsed = 0.0
 
     try:
-        cursor.executemany("""
-            INSERT OR REPLACE INTO financial_data
-            (rssd_id, report_date, year, quarter, mdrm_code, value)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, data_records)
-        conn.commit()
-        return cursor.rowcount
+        for chunk in _batched(data_records, batch_size):
+            start = time.perf_counter()
+            for rows in _batched(chunk, MULTI_ROW_INSERT_ROWS):
+                cursor.execute(_multi_row_insert_sql(len(rows)), tuple(itertools.chain.from_iterable(rows)))
+            if owns_transaction:
+                conn.commit()
+            elapsed += time.perf_counter() - start
+            inserted += len(chunk)
     except sqlite3.Error as e:
+        if not owns_transaction:
+            raise
+        conn.rollback()
         print(f"Error in bulk insert: {e}")
-        return 0
-    finally:
-        conn.close()
 
+    if inserted:
+        print(f"    Inserted {inserted} rows ({inserted / max(elapsed, 1e-9):,.0f} rows/sec)")
+    return inserted
 
-def record_load(year, quarter, source_file, records_loaded, status='completed'):
-    """Record a data load in the history table."""
-    conn = get_connection()
+
+def bulk_load_from_csv(csv_path, table='financial_data'):
+    """
+    Load a CSV of financial data rows, bypassing per-row statement dispatch.
+
+    The CSV needs a header row naming rssd_id, report_date, year, quarter,
+    mdrm_code and value. When the sqlite3 command-line shell is installed its
+    .import loads the file into a staging table that is merged into table in
+    one statement; otherwise rows are streamed through
+    bulk_insert_financial_data.
+
+    Returns:
+        Number of rows loaded
+    """
+    csv_path = Path(csv_path)
+    sqlite_cli = shutil.which('sqlite3')
+
+    # Dot-command arguments are double-quoted with C-style escapes; a newline
+    # would end the command, so such paths take the Python route
+    if sqlite_cli and '\n' not in str(csv_path):
+        columns = "rssd_id, report_date, year, quarter, mdrm_code, value"
+        quoted_path = '"' + str(csv_path).replace('\\', '\\\\').replace('"', '\\"') + '"'
+        script = f"""
+.bail on
+.mode csv
+DROP TABLE IF EXISTS _csv_import;
+.import {quoted_path} _csv_import
+BEGIN;
+INSERT INTO {table} ({columns})
+SELECT rssd_id, report_date, year, quarter, mdrm_code, NULLIF(value, '') FROM _csv_import WHERE true
+ON CONFLICT(rssd_id, report_date, mdrm_code) DO UPDATE SET value = excluded.value
+WHERE {table}.value IS NOT excluded.value;
+SELECT COUNT(*) FROM _csv_import;
+DROP TABLE _csv_import;
+COMMIT;
+"""
+        try:
+            result = subprocess.run(
+                [sqlite_cli, str(DB_PATH)], input=script,
+                capture_output=True, text=True, check=True
+            )
+            return int(result.stdout.strip().splitlines()[-1])
+        except (subprocess.CalledProcessError, ValueError, IndexError) as e:
+            print(f"sqlite3 .import failed, falling back to executemany: {e}")
+
+    with open(csv_path, newline='') as f:
+        reader = csv.DictReader(f)
+        rows = (
+            (row['rssd_id'], row['report_date'], int(row['year']), int(row['quarter']),
+             row['mdrm_code'], int(row['value']) if row['value'] else None)
+            for row in reader
+        )
+        return bulk_insert_financial_data(rows)
+
+
+def record_load(year, quarter, source_file, records_loaded, status='completed', conn=None):
+    """Record a data load in the history table; pass conn from batch_writes() to defer the commit."""
+    owns_transaction = conn is None
+    if owns_transaction:
+        conn = get_connection()
     cursor = conn.cursor()
 
     cursor.execute("""
-        INSERT OR REPLACE INTO load_history
+        INSERT INTO load_history
         (year, quarter, source_file, records_loaded, status)
         VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(year, quarter) DO UPDATE SET
+            source_file = excluded.source_file,
+            records_loaded = excluded.records_loaded,
+            load_timestamp = CURRENT_TIMESTAMP,
+            status = excluded.status
     """, (year, quarter, source_file, records_loaded, status))
 
-    conn.commit()
-    conn.close()
+    if owns_transaction:
+        conn.commit()
 
 
-def get_loaded_quarters():
-    """Get list of (year, quarter) tuples that have been loaded."""
+def refresh_dashboard_view():
+    """
+    Rebuild the financial_dashboard_mv roll-up table.
+
+    Materializes the financial_data x account_definitions join, already in
+    period order, so the dashboard reads a single table with no JOIN or sort.
+    load_all_data and incremental_update run this after loading new data.
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
+    cursor.execute("DROP TABLE IF EXISTS financial_dashboard_mv")
+    cursor.execute(f"CREATE TABLE financial_dashboard_mv AS {DASHBOARD_VIEW_SELECT_SQL}")
+
+    cursor.execute("SELECT COUNT(*) FROM financial_dashboard_mv")
+    row_count = cursor.fetchone()[0]
+
+    conn.commit()
+    print(f"Refreshed dashboard view: {row_count} rows.")
+    return row_count
+
+
+def get_loaded_quarters(conn=None):
+    """Get list of (year, quarter) tuples that have been loaded."""
+    if conn is None:
+        conn = get_connection()
+    cursor = _tuple_cursor(conn)
+
     cursor.execute("""
         SELECT year, quarter FROM load_history
         WHERE status = 'completed'
         ORDER BY year, quarter
     """)
 
-    results = [(row['year'], row['quarter']) for row in cursor.fetchall()]
-    conn.close()
-    return results
-
+    return cursor.fetchall()
 
-def get_balance_sheet(rssd_id, report_date=None, year=None, quarter=None):
-    """Get balance sheet data for an institution."""
-    conn = get_connection()
-    cursor = conn.cursor()
 
-    query = """
-        SELECT ad.account_name, ad.category, fd.value
-        FROM financial_data fd
-        JOIN account_definitions ad ON fd.mdrm_code = ad.mdrm_code
-        WHERE fd.rssd_id = ?
-        AND ad.statement_type = 'balance_sheet'
+@functools.lru_cache(maxsize=None)
+def _statement_query(code_count, by_report_date, by_period):
     """
-    params = [rssd_id]
+    Build the statement query for one filter shape.
 
+    Every call with the same shape gets the identical SQL string, so the
+    connection's statement cache hands back the already-compiled statement.
+    """
+    query = f"""
+        SELECT mdrm_code, value
+        FROM financial_data
+        WHERE rssd_id = ?
+        AND mdrm_code IN ({_in_placeholders(code_count)})
+    """
+    if by_report_date:
+        query += " AND report_date = ?"
+    elif by_period:
+        query += " AND year = ? AND quarter = ?"
+    return query
+
+
+def _get_statement(statement_type, rssd_id, report_date, year, quarter, conn):
+    """Get one statement's account values for an institution."""
+    if conn is None:
+        conn = get_connection()
+    definitions = get_account_definitions()
+    codes = [code for code, (_, statement, _) in definitions.items() if statement == statement_type]
+    if not codes:
+        return {}
+    by_period = bool(year and quarter)
+
+    params = [rssd_id, *codes]
     if report_date:
-        query += " AND fd.report_date = ?"
         params.append(report_date)
-    elif year and quarter:
-        query += " AND fd.year = ? AND fd.quarter = ?"
+    elif by_period:
         params.extend([year, quarter])
 
-    query += " ORDER BY ad.category, ad.account_name"
+    cursor = _tuple_cursor(conn)
+    cursor.execute(_statement_query(len(codes), bool(report_date), by_period), params)
+    rows = sorted(
+        (definitions[mdrm_code][2], definitions[mdrm_code][0], value)
+        for mdrm_code, value in cursor.fetchall()
+    )
+    return dict(row[1:] for row in rows)
 
-    cursor.execute(query, params)
-    results = {row['account_name']: row['value'] for row in cursor.fetchall()}
-    conn.close()
-    return results
 
+def get_balance_sheet(rssd_id, report_date=None, year=None, quarter=None, conn=None):
+    """Get balance sheet data for an institution."""
+    return _get_statement('balance_sheet', rssd_id, report_date, year, quarter, conn)
 
-def get_income_statement(rssd_id, report_date=None, year=None, quarter=None):
+
+def get_income_statement(rssd_id, report_date=None, year=None, quarter=None, conn=None):
     """Get income statement data for an institution."""
-    conn = get_connection()
-    cursor = conn.cursor()
+    return _get_statement('income_statement', rssd_id, report_date, year, quarter, conn)
 
+
+@functools.lru_cache(maxsize=None)
+def _time_series_query(code_count, has_start_year, has_end_year):
+    """Build the time series query for one filter shape (see _statement_query)."""
     query = """
-        SELECT ad.account_name, ad.category, fd.value
-        FROM financial_data fd
-        JOIN account_definitions ad ON fd.mdrm_code = ad.mdrm_code
-        WHERE fd.rssd_id = ?
-        AND ad.statement_type = 'income_statement'
+        SELECT report_date, value
+        FROM financial_data
+        WHERE rssd_id = ?
     """
-    params = [rssd_id]
+    if code_count is not None:
+        query += f" AND mdrm_code IN ({_in_placeholders(code_count)})"
+    if has_start_year:
+        query += " AND year >= ?"
+    if has_end_year:
+        query += " AND year <= ?"
+    return query + " ORDER BY report_date"
 
-    if report_date:
-        query += " AND fd.report_date = ?"
-        params.append(report_date)
-    elif year and quarter:
-        query += " AND fd.year = ? AND fd.quarter = ?"
-        params.extend([year, quarter])
 
-    query += " ORDER BY ad.category, ad.account_name"
+def get_time_series(rssd_id, mdrm_code=None, account_name=None, start_year=None, end_year=None,
+                    conn=None):
+    """Get time series data for a specific account."""
+    if conn is None:
+        conn = get_connection()
+    definitions = get_account_definitions()
+
+    # Resolve the account filter to MDRM codes; None means every defined code
+    codes = None
+    if mdrm_code:
+        codes = [mdrm_code] if mdrm_code in definitions else []
+    elif account_name:
+        needle = account_name.lower()
+        codes = [code for code, (name, _, _) in definitions.items() if needle in name.lower()]
+    if codes == []:
+        return []
 
+    params = [rssd_id]
+    if codes is not None:
+        params.extend(codes)
+    if start_year:
+        params.append(start_year)
+    if end_year:
+        params.append(end_year)
+
+    query = _time_series_query(
+        None if codes is None else len(codes), bool(start_year), bool(end_year)
+    )
+    cursor = _tuple_cursor(conn)
     cursor.execute(query, params)
-    results = {row['account_name']: row['value'] for row in cursor.fetchall()}
-    conn.close()
-    return results
+    return cursor.fetchall()
 
 
-def get_time_series(rssd_id, mdrm_code=None, account_name=None, start_year=None, end_year=None):
-    """Get time series data for a specific account."""
-    conn = get_connection()
-    cursor = conn.cursor()
+def analytics_connection():
+    """
+    Open a DuckDB connection with the database attached read-only as y9c.
 
-    query = """
-        SELECT fd.report_date, fd.year, fd.quarter, fd.value, ad.account_name
-        FROM financial_data fd
-        JOIN account_definitions ad ON fd.mdrm_code = ad.mdrm_code
-        WHERE fd.rssd_id = ?
+    DuckDB's vectorized engine suits scans and aggregations over the whole
+    history; writes keep going through the SQLite helpers above. Returns None
+    if DuckDB isn't installed or its sqlite extension can't be loaded (it is
+    downloaded on first use), so callers can fall back.
     """
-    params = [rssd_id]
+    try:
+        import duckdb
+    except ImportError:
+        return None
 
-    if mdrm_code:
-        query += " AND fd.mdrm_code = ?"
-        params.append(mdrm_code)
-    elif account_name:
-        query += " AND ad.account_name LIKE ?"
-        params.append(f"%{account_name}%")
+    try:
+        con = duckdb.connect()
+        con.execute("INSTALL sqlite; LOAD sqlite;")
+        db_path = str(DB_PATH).replace("'", "''")
+        con.execute(f"ATTACH '{db_path}' AS y9c (TYPE SQLITE, READ_ONLY)")
+        return con
+    except duckdb.Error:
+        return None
 
+
+def get_time_series_table(rssd_id, mdrm_codes=None, start_year=None, end_year=None):
+    """
+    Get time series rows for many accounts at once as an Arrow table.
+
+    Reads through analytics_connection(), returning columns report_date,
+    year, quarter, mdrm_code and value ordered by report date, or None when
+    DuckDB is unavailable.
+    """
+    con = analytics_connection()
+    if con is None:
+        return None
+
+    query = """
+        SELECT report_date, year, quarter, mdrm_code, value
+        FROM y9c.financial_data
+        WHERE rssd_id = ?
+    """
+    params = [rssd_id]
+    if mdrm_codes:
+        query += f" AND mdrm_code IN ({_in_placeholders(len(mdrm_codes))})"
+        params.extend(mdrm_codes)
     if start_year:
-        query += " AND fd.year >= ?"
+        query += " AND year >= ?"
         params.append(start_year)
     if end_year:
-        query += " AND fd.year <= ?"
+        query += " AND year <= ?"
         params.append(end_year)
+    query += " ORDER BY report_date, mdrm_code"
 
-    query += " ORDER BY fd.report_date"
-
-    cursor.execute(query, params)
-    results = [(row['report_date'], row['value']) for row in cursor.fetchall()]
-    conn.close()
-    return results
+    with con:
+        return con.execute(query, params).fetch_arrow_table()
 
 
-def get_all_periods(rssd_id):
+def get_all_periods(rssd_id, conn=None):
     """Get all available periods for an institution."""
-    conn = get_connection()
-    cursor = conn.cursor()
+    if conn is None:
+        conn = get_connection()
+    cursor = _tuple_cursor(conn)
 
     cursor.execute("""
         SELECT DISTINCT year, quarter, report_date
@@ -332,50 +765,108 @@ def get_all_periods(rssd_id):
         ORDER BY year, quarter
     """, (rssd_id,))
 
-    results = [(row['year'], row['quarter'], row['report_date']) for row in cursor.fetchall()]
-    conn.close()
-    return results
+    return cursor.fetchall()
 
 
-def export_to_csv(rssd_id, output_path, statement_type=None):
-    """Export data to CSV format."""
-    import csv
+# Rows per fetchmany call when streaming exports
+EXPORT_FETCH_SIZE = 10000
 
-    conn = get_connection()
-    cursor = conn.cursor()
+EXPORT_COLUMNS = ['report_date', 'year', 'quarter', 'mdrm_code',
+                  'account_name', 'statement_type', 'category', 'value']
 
-    query = """
-        SELECT fd.report_date, fd.year, fd.quarter, fd.mdrm_code,
-               ad.account_name, ad.statement_type, ad.category, fd.value
-        FROM financial_data fd
-        JOIN account_definitions ad ON fd.mdrm_code = ad.mdrm_code
-        WHERE fd.rssd_id = ?
+
+def iter_export_rows(rssd_id, statement_type=None):
     """
-    params = [rssd_id]
+    Yield export rows (see EXPORT_COLUMNS) ordered by report date, statement
+    type, category and account name.
+
+    Rows are fetched EXPORT_FETCH_SIZE at a time and sorted one report date at
+    a time, so memory stays bounded by a single quarter's data.
+    """
+    definitions = get_account_definitions()
 
-    if statement_type:
-        query += " AND ad.statement_type = ?"
-        params.append(statement_type)
+    cursor = _tuple_cursor(get_connection())
+    cursor.execute("""
+        SELECT report_date, year, quarter, mdrm_code, value
+        FROM financial_data
+        WHERE rssd_id = ?
+        ORDER BY report_date
+    """, (rssd_id,))
 
-    query += " ORDER BY fd.report_date, ad.statement_type, ad.category, ad.account_name"
+    def fetched():
+        while rows := cursor.fetchmany(EXPORT_FETCH_SIZE):
+            yield from rows
+
+    for _, period_rows in itertools.groupby(fetched(), key=lambda row: row[0]):
+        rows = []
+        for report_date, year, quarter, mdrm_code, value in period_rows:
+            definition = definitions.get(mdrm_code)
+            if definition is None or (statement_type and definition[1] != statement_type):
+                continue
+            account_name, statement, category = definition
+            rows.append((report_date, year, quarter, mdrm_code,
+                         account_name, statement, category, value))
+        rows.sort(key=lambda row: (row[5], row[6], row[4]))
+        yield from rows
 
-    cursor.execute(query, params)
 
+def export_to_csv(rssd_id, output_path, statement_type=None):
+    """Export data to CSV format."""
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
-        writer.writerow(['report_date', 'year', 'quarter', 'mdrm_code',
-                         'account_name', 'statement_type', 'category', 'value'])
-        for row in cursor.fetchall():
-            writer.writerow(list(row))
+        writer.writerow(EXPORT_COLUMNS)
+        writer.writerows(iter_export_rows(rssd_id, statement_type))
+
+    print(f"Exported data to {output_path}")
+
+
+def export_to_parquet(rssd_id, output_path, statement_type=None):
+    """
+    Export data to a zstd-compressed Parquet file (requires pyarrow).
+
+    Text columns are dictionary-encoded, so the file stays small and loads
+    straight into pandas or DuckDB without CSV parsing.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("  pyarrow not installed. Install with: pip install pyarrow")
+        return None
+
+    schema = pa.schema([
+        ('report_date', pa.string()),
+        ('year', pa.int16()),
+        ('quarter', pa.int8()),
+        ('mdrm_code', pa.string()),
+        ('account_name', pa.string()),
+        ('statement_type', pa.string()),
+        ('category', pa.string()),
+        ('value', pa.int64()),
+    ])
+    batches = (
+        pa.RecordBatch.from_arrays([pa.array(column, type=field.type)
+                                    for column, field in zip(zip(*chunk), schema)],
+                                   schema=schema)
+        for chunk in _batched(iter_export_rows(rssd_id, statement_type), EXPORT_FETCH_SIZE)
+    )
+    table = pa.Table.from_batches(batches, schema=schema)
+
+    pq.write_table(
+        table, output_path, compression='zstd',
+        use_dictionary=['mdrm_code', 'account_name', 'statement_type', 'category']
+    )
 
-    conn.close()
     print(f"Exported data to {output_path}")
+    return output_path
 
 
 def initialize_database():
     """Initialize the database with schema and USAA institution data."""
     create_schema()
     populate_account_definitions()
+    # Account names feed the dashboard table, so rebuild it with the current ones
+    refresh_dashboard_view()
 
     add_institution(
         rssd_id=USAA_HOLDING_COMPANY_RSSD,
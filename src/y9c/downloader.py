@@ -8,12 +8,31 @@ This script handles:
 2. Current data from FFIEC NIC (2021+)
 """
 
+import atexit
+import functools
+import hashlib
+import io
+import itertools
+import json
+import math
+import os
+import re
 import requests
+import urllib3
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+import random
+import threading
 import time
 import shutil
+import struct
+
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
 
 # Data directories at project root
 DATA_DIR = Path(__file__).parent.parent.parent / "data" / "raw"
@@ -22,6 +41,152 @@ MANUAL_DOWNLOAD_DIR = Path(__file__).parent.parent.parent / "data" / "manual_dow
 
 FFIEC_DOWNLOAD_URL = "https://www.ffiec.gov/npw/FinancialReport/FinancialDataDownload"
 
+# Quarters are fetched concurrently; downloads are network-bound
+DOWNLOAD_WORKERS = 8
+
+# Month and day each quarter ends, indexed by quarter - 1
+QUARTER_END_MMDD = ('0331', '0630', '0930', '1231')
+
+# Names download_nic_data / download_chicago_fed_data save archives under
+CANONICAL_ZIP_NAME = re.compile(r"BHCF_(\d{4})Q([1-4])(_chicago)?\.zip")
+
+# (connect, read) timeouts in seconds: fail fast on unreachable hosts while
+# still allowing slow transfers of large archives
+DOWNLOAD_TIMEOUT = (10, 120)
+
+# Longest wait between download attempts, whether backing off or told to by
+# a server's Retry-After
+MAX_RETRY_DELAY = 30.0
+
+# ZIP end-of-central-directory record: signature, fixed size, and the most
+# comment bytes that may follow it
+ZIP_EOCD_SIGNATURE = b'PK\x05\x06'
+ZIP_EOCD_SIZE = 22
+ZIP_MAX_COMMENT = 0xFFFF
+
+# Transient failures worth another attempt. save_response streams through
+# response.raw, where a dropped or reset connection surfaces as a urllib3 or
+# OSError rather than a requests exception.
+RETRYABLE_ERRORS = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, ConnectionError)
+
+# Selenium downloads land in DATA_DIR under a browser-chosen name and are
+# renamed afterwards, so only one browser download may run at a time
+_SELENIUM_LOCK = threading.Lock()
+
+# Headless Chrome shared by all Selenium downloads; see _get_driver()
+_driver = None
+
+# How long to wait for a browser download to finish, and how often to look
+SELENIUM_DOWNLOAD_TIMEOUT = 120
+SELENIUM_POLL_INTERVAL = 0.5
+
+# ETag / Last-Modified of each saved archive, keyed by URL, so that refresh
+# runs can ask the server whether a quarter changed instead of refetching it
+VALIDATORS_FILE = DATA_DIR / ".etags.json"
+_VALIDATORS_LOCK = threading.Lock()
+
+_thread_local = threading.local()
+
+
+def get_session():
+    """Return this thread's requests.Session so connections are kept alive and reused."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
+def _backoff(attempt, base=1.0, cap=MAX_RETRY_DELAY):
+    """Full-jitter exponential backoff, so parallel retries don't line up."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def _retry_after(response):
+    """Return the Retry-After delay in seconds for a 429/503 response, if given, capped at MAX_RETRY_DELAY."""
+    if response.status_code not in (429, 503):
+        return None
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+    if not math.isfinite(delay):
+        return None
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+@functools.lru_cache(maxsize=1)
+def _data_dir_listing(data_dir, mtime_ns):
+    """List the BHCF_*.zip names in data_dir; cached per directory mtime."""
+    with os.scandir(data_dir) as entries:
+        return frozenset(entry.name for entry in entries
+                         if entry.name.startswith("BHCF_") and entry.name.endswith(".zip"))
+
+
+def existing_data_files():
+    """
+    Return the names of the BHCF_*.zip files in DATA_DIR.
+
+    The directory is listed once and reused until its mtime changes, so
+    per-quarter existence checks cost one stat() instead of one per
+    candidate file. Writers into DATA_DIR also clear the cache, covering
+    filesystems with coarse mtimes.
+    """
+    try:
+        mtime_ns = DATA_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return frozenset()
+    return _data_dir_listing(str(DATA_DIR), mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _manual_listing(manual_dir, mtime_ns):
+    """List the .zip names in manual_dir; cached per directory mtime."""
+    with os.scandir(manual_dir) as entries:
+        return tuple(sorted(entry.name for entry in entries if entry.name.endswith(".zip")))
+
+
+def manual_download_files():
+    """
+    Return the .zip names in MANUAL_DOWNLOAD_DIR.
+
+    Cached like existing_data_files(), so checking every quarter for a manual
+    download scans the directory once rather than once per quarter.
+    """
+    try:
+        mtime_ns = MANUAL_DOWNLOAD_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    return _manual_listing(str(MANUAL_DOWNLOAD_DIR), mtime_ns)
+
+
+def is_complete_zip(path):
+    """
+    Cheaply check that path ends with a ZIP end-of-central-directory record.
+
+    Only the tail of the file is read (the record plus the longest possible
+    archive comment), which is enough to reject empty or truncated downloads.
+    """
+    try:
+        with open(path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size < ZIP_EOCD_SIZE:
+                return False
+            f.seek(max(0, size - ZIP_EOCD_SIZE - ZIP_MAX_COMMENT))
+            return f.read().rfind(ZIP_EOCD_SIGNATURE) != -1
+    except FileNotFoundError:
+        return False
+
+
+def have_archive(output_file):
+    """True if output_file is in DATA_DIR as a complete archive; a truncated one is reported and re-fetched."""
+    if output_file.name not in existing_data_files():
+        return False
+    if is_complete_zip(output_file):
+        return True
+    print(f"  Incomplete archive, fetching again: {output_file.name}")
+    return False
+
 
 def ensure_directories():
     """Create necessary directories if they don't exist."""
@@ -32,19 +197,43 @@ def ensure_directories():
 
 def get_quarter_dates(year, quarter):
     """Return the quarter end date in YYYYMMDD format."""
-    quarter_ends = {
-        1: f"{year}0331",
-        2: f"{year}0630",
-        3: f"{year}0930",
-        4: f"{year}1231",
-    }
-    return quarter_ends[quarter]
+    return f"{year}{QUARTER_END_MMDD[quarter - 1]}"
+
+
+def all_quarters(start_year=2000, end_year=None):
+    """Yield (year, quarter) from start_year through end_year, stopping at the current quarter."""
+    now = datetime.now()
+    current_quarter = (now.month - 1) // 3 + 1
+    if end_year is None:
+        end_year = now.year
+
+    for year in range(start_year, min(end_year, now.year) + 1):
+        max_quarter = current_quarter if year == now.year else 4
+        for quarter in range(1, max_quarter + 1):
+            yield year, quarter
+
+
+def _import_manual_download(manual_path, target_path):
+    """
+    Put a manually downloaded archive at target_path.
+
+    Hard-linked when both directories share a filesystem, so no bytes are
+    copied; otherwise copied without metadata, which nothing downstream reads.
+    """
+    try:
+        os.link(manual_path, target_path)
+    except OSError:
+        shutil.copyfile(manual_path, target_path)
+    _data_dir_listing.cache_clear()
 
 
 def check_for_manual_download(year, quarter):
-    """Check if a file was manually downloaded."""
-    ensure_directories()
+    """
+    Check if a file was manually downloaded.
 
+    Runs for every quarter, so the directories are left to the once-per-run
+    ensure_directories() in download_all_y9c_data and the other entry points.
+    """
     patterns = [
         f"BHCF_{year}Q{quarter}.zip",
         f"BHCF_{year}{quarter}.zip",
@@ -52,52 +241,112 @@ def check_for_manual_download(year, quarter):
         f"BHCF{year}Q{quarter}.zip",
     ]
 
+    manual_files = manual_download_files()
+
     for pattern in patterns:
         manual_path = MANUAL_DOWNLOAD_DIR / pattern
-        if manual_path.exists():
+        if pattern in manual_files:
             target_path = DATA_DIR / f"BHCF_{year}Q{quarter}.zip"
-            shutil.copy2(manual_path, target_path)
+            _import_manual_download(manual_path, target_path)
             print(f"  Found manual download: {manual_path.name} -> {target_path.name}")
             return target_path
 
-    for f in MANUAL_DOWNLOAD_DIR.glob("*.zip"):
+    for name in manual_files:
+        f = MANUAL_DOWNLOAD_DIR / name
         if str(year) in f.name and str(quarter) in f.name:
             target_path = DATA_DIR / f"BHCF_{year}Q{quarter}.zip"
-            shutil.copy2(f, target_path)
+            _import_manual_download(f, target_path)
             print(f"  Found manual download: {f.name} -> {target_path.name}")
             return target_path
 
     return None
 
 
+def _browser_downloads():
+    """
+    Names of .zip files in DATA_DIR other than the ones this module names.
+
+    Concurrent direct downloads write canonical BHCF_<year>Q<quarter> names,
+    so excluding those leaves only files the browser saved.
+    """
+    with os.scandir(DATA_DIR) as entries:
+        return {entry.name for entry in entries
+                if entry.name.endswith('.zip') and not CANONICAL_ZIP_NAME.fullmatch(entry.name)}
+
+
+def _wait_for_browser_download(output_file, before, timeout=SELENIUM_DOWNLOAD_TIMEOUT):
+    """
+    Poll DATA_DIR until the browser has finished saving a download.
+
+    Done once output_file or a new .zip other than those in before exists and
+    no Chrome .crdownload partial is left. Returns False on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with os.scandir(DATA_DIR) as entries:
+            names = {entry.name for entry in entries}
+        in_progress = any(name.endswith('.crdownload') for name in names)
+        if not in_progress and (output_file.name in names or _browser_downloads() - before):
+            return True
+        time.sleep(SELENIUM_POLL_INTERVAL)
+    return False
+
+
+def _get_driver():
+    """
+    Return the shared headless Chrome driver, starting it on first use.
+
+    Starting Chrome takes seconds, so one browser serves every quarter and is
+    quit at exit. Callers hold _SELENIUM_LOCK.
+    """
+    global _driver
+    if _driver is None:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_experimental_option("prefs", {
+            "download.default_directory": str(DATA_DIR),
+            "download.prompt_for_download": False,
+            "download.directory_upgrade": True,
+        })
+        _driver = webdriver.Chrome(options=chrome_options)
+        atexit.register(_quit_driver)
+    return _driver
+
+
+def _quit_driver():
+    """Quit the shared driver, if running, so the next _get_driver() starts afresh."""
+    global _driver
+    if _driver is not None:
+        try:
+            _driver.quit()
+        except Exception:
+            pass
+        _driver = None
+        atexit.unregister(_quit_driver)
+
+
 def download_nic_data_selenium(year, quarter):
     """Download Y-9C data from FFIEC NIC using Selenium."""
     try:
-        from selenium import webdriver
+        from selenium.common.exceptions import WebDriverException
         from selenium.webdriver.common.by import By
         from selenium.webdriver.support.ui import Select, WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.chrome.options import Options
     except ImportError:
         print("  Selenium not installed. Install with: pip install selenium")
         return None
 
     output_file = DATA_DIR / f"BHCF_{year}Q{quarter}.zip"
 
-    if output_file.exists():
+    if have_archive(output_file):
         print(f"  File already exists: {output_file.name}")
         return output_file
 
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_experimental_option("prefs", {
-        "download.default_directory": str(DATA_DIR),
-        "download.prompt_for_download": False,
-        "download.directory_upgrade": True,
-    })
-
     try:
-        driver = webdriver.Chrome(options=chrome_options)
+        driver = _get_driver()
         wait = WebDriverWait(driver, 30)
 
         print(f"  Opening FFIEC download page for {year} Q{quarter}...")
@@ -112,81 +361,293 @@ def download_nic_data_selenium(year, quarter):
         quarter_select = wait.until(EC.presence_of_element_located((By.ID, "SelectedQuarter")))
         Select(quarter_select).select_by_value(str(quarter))
 
+        before = _browser_downloads()
+
         download_btn = wait.until(EC.element_to_be_clickable((By.ID, "btnDownload")))
         download_btn.click()
 
-        time.sleep(10)
+        _wait_for_browser_download(output_file, before)
 
-        driver.quit()
+        _data_dir_listing.cache_clear()
 
-        if output_file.exists():
+        if is_complete_zip(output_file):
             print(f"  Downloaded: {output_file.name}")
             return output_file
         else:
-            for f in DATA_DIR.glob("*.zip"):
-                if f.stat().st_mtime > time.time() - 60:
-                    f.rename(output_file)
-                    print(f"  Downloaded and renamed: {output_file.name}")
-                    return output_file
+            new_files = _browser_downloads() - before
+            if len(new_files) == 1:
+                (DATA_DIR / new_files.pop()).rename(output_file)
+                _data_dir_listing.cache_clear()
+                print(f"  Downloaded and renamed: {output_file.name}")
+                return output_file
 
         print(f"  Download may have failed for {year} Q{quarter}")
         return None
 
+    except WebDriverException as e:
+        # The browser may be dead; start a fresh one for the next quarter
+        _quit_driver()
+        print(f"  Selenium error for {year} Q{quarter}: {e}")
+        return None
     except Exception as e:
         print(f"  Selenium error for {year} Q{quarter}: {e}")
         return None
 
 
-def download_nic_data(year, quarter, max_retries=3):
-    """Download Y-9C data from FFIEC NIC for a specific quarter."""
+def _part_file(output_file):
+    """Where save_response writes output_file while it is in progress."""
+    return output_file.with_name(output_file.name + '.part')
+
+
+def resume_headers(url, output_file):
+    """
+    Headers continuing a partial download of output_file from url, if one was left behind.
+
+    The Range request carries an If-Range with the validator recorded when the
+    .part file was started, so a server whose file has changed since sends
+    the whole new file (a 200) rather than the tail of it. Without a usable
+    validator nothing is resumed.
+    """
+    part_file = _part_file(output_file)
+    try:
+        size = part_file.stat().st_size
+    except FileNotFoundError:
+        return {}
+    with _VALIDATORS_LOCK:
+        entry = _load_validators().get(url)
+    if not size or not entry or entry.get('file') != part_file.name:
+        return {}
+
+    # If-Range only accepts a strong ETag
+    etag = entry.get('etag')
+    validator = etag if etag and not etag.startswith('W/') else entry.get('last_modified')
+    if not validator:
+        return {}
+    return {'Range': f'bytes={size}-', 'If-Range': validator, 'Accept-Encoding': 'identity'}
+
+
+def resume_matches(response, output_file):
+    """
+    Whether a 206 response continues output_file's .part file.
+
+    The Content-Range must start where the .part file ends, and the body must
+    not be content-encoded: it is decoded as it is written, so the file's
+    size is no longer an offset into what the server sends.
+    """
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        return False
+    match = re.match(r'bytes (\d+)-\d+/(?:\d+|\*)$', response.headers.get('Content-Range', '').strip())
+    try:
+        size = _part_file(output_file).stat().st_size
+    except FileNotFoundError:
+        return False
+    return match is not None and int(match.group(1)) == size
+
+
+def save_response(response, output_file, magic=b'', min_size=0, url=None):
+    """
+    Stream a response body to output_file without holding it in memory.
+
+    The body is written to a .part file and renamed into place only once it
+    is complete, so an interrupted download never looks like a finished one.
+    If the transfer breaks off, the .part file is kept and a 206 Partial
+    Content response to a resume_headers() request is appended to it; a
+    full 200 response starts it over. Callers check a 206 with
+    resume_matches() first. With url, the validators of a 200 response that
+    isn't content-encoded are recorded for the .part file, which is what
+    makes it resumable.
+    Its SHA-256 is computed during the copy and saved alongside as
+    <name>.sha256.
+    Returns False, leaving nothing behind, if the body doesn't start with
+    magic or is shorter than min_size bytes. Responses whose headers already
+    rule them out (an HTML error page, or a Content-Length under min_size)
+    are rejected before any of the body is read.
+    """
+    part_file = _part_file(output_file)
+    resuming = response.status_code == 206 and part_file.exists()
+
+    if response.headers.get('Content-Type', '').startswith('text/html'):
+        return False
+    content_length = response.headers.get('Content-Length', '')
+    if (not resuming and 'Content-Encoding' not in response.headers
+            and content_length.isdigit() and int(content_length) < min_size):
+        return False
+
+    response.raw.decode_content = True
+    digest = hashlib.sha256()
+    size = 0
+    if resuming:
+        with open(part_file, 'rb') as f:
+            head = f.read(len(magic))
+            digest.update(head)
+            size = len(head)
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+                size += len(chunk)
+        mode = 'ab'
+    else:
+        head = response.raw.read(len(magic))
+        digest.update(head)
+        size = len(head)
+        mode = 'wb'
+    if head != magic:
+        part_file.unlink(missing_ok=True)
+        return False
+    if (url and not resuming
+            and response.headers.get('Content-Encoding', 'identity') == 'identity'):
+        record_validators(url, response, part_file)
+
+    try:
+        with open(part_file, mode) as f:
+            if not resuming:
+                f.write(head)
+            while chunk := response.raw.read(1 << 20):
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        if size < min_size:
+            part_file.unlink()
+            return False
+        # sha256sum-compatible checksum, hashed during the copy instead of re-read
+        output_file.with_name(output_file.name + '.sha256').write_text(
+            f"{digest.hexdigest()}  {output_file.name}\n"
+        )
+        part_file.replace(output_file)
+        _data_dir_listing.cache_clear()
+    except RETRYABLE_ERRORS + (KeyboardInterrupt,):
+        # Keep what arrived so the next attempt can resume with a Range request
+        raise
+    except BaseException:
+        part_file.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def _load_validators():
+    try:
+        return json.loads(VALIDATORS_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def conditional_headers(url, output_file):
+    """
+    If-None-Match / If-Modified-Since headers for an archive saved from url.
+
+    Empty if output_file is missing or the server sent no validators for it.
+    """
+    if not is_complete_zip(output_file):
+        return {}
+    with _VALIDATORS_LOCK:
+        entry = _load_validators().get(url)
+    if not entry or entry.get('file') != output_file.name:
+        return {}
+
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def record_validators(url, response, output_file):
+    """Remember the ETag / Last-Modified the server sent with output_file."""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+
+    with _VALIDATORS_LOCK:
+        validators = _load_validators()
+        validators[url] = {'etag': etag, 'last_modified': last_modified, 'file': output_file.name}
+        part_file = VALIDATORS_FILE.with_name(VALIDATORS_FILE.name + '.part')
+        part_file.write_text(json.dumps(validators, indent=2, sort_keys=True))
+        part_file.replace(VALIDATORS_FILE)
+
+
+def nic_url(year, quarter):
+    """FFIEC NIC bulk download URL for a quarter."""
     date_str = get_quarter_dates(year, quarter)
-    output_file = DATA_DIR / f"BHCF_{year}Q{quarter}.zip"
+    return f"https://www.ffiec.gov/npw/FinancialReport/ReturnFinancialReportZip?rpt=BHCF&date={date_str}"
+
+
+def chicago_fed_url(year, quarter):
+    """Chicago Fed bulk download URL for a quarter."""
+    return f"https://www.chicagofed.org/api/sitecore/BHCHome/BHCDownload?SelectedQuarter={quarter}&SelectedYear={year}"
 
-    if output_file.exists():
-        print(f"  File already exists: {output_file.name}")
-        return output_file
 
-    manual_file = check_for_manual_download(year, quarter)
-    if manual_file:
-        return manual_file
+def download_nic_data(year, quarter, max_retries=3, refresh=False):
+    """
+    Download Y-9C data from FFIEC NIC for a specific quarter.
 
-    selenium_result = download_nic_data_selenium(year, quarter)
-    if selenium_result:
-        return selenium_result
+    An existing file is returned as is unless refresh is set, in which case
+    the server is asked (by a conditional GET) whether it has changed.
+    """
+    output_file = DATA_DIR / f"BHCF_{year}Q{quarter}.zip"
+    url = nic_url(year, quarter)
 
-    url = f"https://www.ffiec.gov/npw/FinancialReport/ReturnFinancialReportZip?rpt=BHCF&date={date_str}"
+    if have_archive(output_file):
+        if not refresh:
+            print(f"  File already exists: {output_file.name}")
+            return output_file
+    else:
+        manual_file = check_for_manual_download(year, quarter)
+        if manual_file:
+            return manual_file
+
+        with _SELENIUM_LOCK:
+            selenium_result = download_nic_data_selenium(year, quarter)
+        if selenium_result:
+            return selenium_result
 
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "application/zip, application/octet-stream, */*",
+        **conditional_headers(url, output_file),
     }
 
     for attempt in range(max_retries):
+        retry_after = None
         try:
             print(f"  Trying direct download {year} Q{quarter} (attempt {attempt + 1})...")
-            response = requests.get(url, headers=headers, timeout=120)
-
-            if response.status_code == 200:
-                if response.content[:2] == b'PK':
-                    with open(output_file, 'wb') as f:
-                        f.write(response.content)
-                    print(f"  Saved: {output_file.name}")
+            with get_session().get(url, headers={**headers, **resume_headers(url, output_file)},
+                                   timeout=DOWNLOAD_TIMEOUT, stream=True) as response:
+                retry_after = _retry_after(response)
+
+                if response.status_code == 206 and not resume_matches(response, output_file):
+                    # Not the continuation of the .part file; start over
+                    _part_file(output_file).unlink(missing_ok=True)
+                elif response.status_code in (200, 206):
+                    if save_response(response, output_file, magic=b'PK', url=url):
+                        record_validators(url, response, output_file)
+                        print(f"  Saved: {output_file.name}")
+                        return output_file
+                    else:
+                        break
+                elif response.status_code == 304:
+                    print(f"  Not modified: {output_file.name}")
                     return output_file
-                else:
+                elif response.status_code == 404:
+                    print(f"  Data not available for {year} Q{quarter}")
+                    return None
+                elif response.status_code == 403:
                     break
-            elif response.status_code == 404:
-                print(f"  Data not available for {year} Q{quarter}")
-                return None
-            elif response.status_code == 403:
-                break
+                elif response.status_code == 416:
+                    # The partial file doesn't fit the archive on the server; start over
+                    _part_file(output_file).unlink(missing_ok=True)
 
         except requests.exceptions.Timeout:
             print(f"  Timeout on attempt {attempt + 1}")
-        except requests.exceptions.RequestException as e:
+        except RETRYABLE_ERRORS as e:
             print(f"  Error on attempt {attempt + 1}: {e}")
 
         if attempt < max_retries - 1:
-            time.sleep(2 ** attempt)
+            time.sleep(retry_after if retry_after is not None else _backoff(attempt))
+
+    if is_complete_zip(output_file):
+        print(f"  Could not refresh {output_file.name}; keeping the existing file")
+        return output_file
 
     print(f"\n  ** Manual download required for {year} Q{quarter} **")
     print(f"  1. Go to: {FFIEC_DOWNLOAD_URL}")
@@ -200,48 +661,182 @@ def download_nic_data(year, quarter, max_retries=3):
     return None
 
 
-def download_chicago_fed_data(year, quarter, max_retries=3):
-    """Download historical Y-9C data from Chicago Fed (pre-2021)."""
-    url = f"https://www.chicagofed.org/api/sitecore/BHCHome/BHCDownload?SelectedQuarter={quarter}&SelectedYear={year}"
+def download_chicago_fed_data(year, quarter, max_retries=3, refresh=False):
+    """Download historical Y-9C data from Chicago Fed (pre-2021); refresh as in download_nic_data."""
+    url = chicago_fed_url(year, quarter)
 
     output_file = DATA_DIR / f"BHCF_{year}Q{quarter}_chicago.zip"
 
-    if output_file.exists():
+    if not refresh and have_archive(output_file):
         print(f"  File already exists: {output_file.name}")
         return output_file
 
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "*/*",
+        **conditional_headers(url, output_file),
     }
 
     for attempt in range(max_retries):
+        retry_after = None
         try:
             print(f"  Downloading {year} Q{quarter} from Chicago Fed...")
-            response = requests.get(url, headers=headers, timeout=120, allow_redirects=True)
-
-            if response.status_code == 200 and len(response.content) > 1000:
-                with open(output_file, 'wb') as f:
-                    f.write(response.content)
-                print(f"  Saved: {output_file.name}")
-                return output_file
-            elif response.status_code == 404:
-                print(f"  Data not available for {year} Q{quarter}")
-                return None
-            else:
-                print(f"  HTTP {response.status_code} (size: {len(response.content)}) for {year} Q{quarter}")
+            with get_session().get(url, headers={**headers, **resume_headers(url, output_file)},
+                                   timeout=DOWNLOAD_TIMEOUT, allow_redirects=True,
+                                   stream=True) as response:
+                retry_after = _retry_after(response)
+
+                if response.status_code == 206 and not resume_matches(response, output_file):
+                    # Not the continuation of the .part file; start over
+                    _part_file(output_file).unlink(missing_ok=True)
+                elif response.status_code in (200, 206) and save_response(response, output_file, min_size=1001, url=url):
+                    record_validators(url, response, output_file)
+                    print(f"  Saved: {output_file.name}")
+                    return output_file
+                elif response.status_code == 304:
+                    print(f"  Not modified: {output_file.name}")
+                    return output_file
+                elif response.status_code == 404:
+                    print(f"  Data not available for {year} Q{quarter}")
+                    return None
+                elif response.status_code == 416:
+                    # The partial file doesn't fit the archive on the server; start over
+                    _part_file(output_file).unlink(missing_ok=True)
+                else:
+                    print(f"  HTTP {response.status_code} (no usable file) for {year} Q{quarter}")
 
         except requests.exceptions.Timeout:
             print(f"  Timeout on attempt {attempt + 1}")
-        except requests.exceptions.RequestException as e:
+        except RETRYABLE_ERRORS as e:
             print(f"  Error on attempt {attempt + 1}: {e}")
 
         if attempt < max_retries - 1:
-            time.sleep(2 ** attempt)
+            time.sleep(retry_after if retry_after is not None else _backoff(attempt))
+
+    if is_complete_zip(output_file):
+        return output_file
 
     return None
 
 
+def _isal_inflatable(zf, info):
+    """Whether ISA-L can inflate a member straight from the archive file."""
+    return (isal_zlib is not None and zf.filename is not None
+            and info.compress_type == zipfile.ZIP_DEFLATED and not info.flag_bits & 0x1)
+
+
+def _seek_member_data(f, info):
+    """Position f, the open archive file, at the start of a member's compressed data."""
+    f.seek(info.header_offset)
+    header = f.read(30)
+    if header[:4] != b'PK\x03\x04':
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+    name_len, extra_len = struct.unpack('<HH', header[26:30])
+    f.seek(info.header_offset + 30 + name_len + extra_len)
+
+
+class _IsalMemberReader(io.RawIOBase):
+    """
+    Stream one DEFLATE ZIP member, inflating it incrementally with ISA-L.
+
+    Compressed input is read in READ_CHUNK pieces and the CRC is checked once
+    the stream ends, so memory use stays bounded whatever the member size.
+    """
+
+    READ_CHUNK = 1 << 20
+
+    def __init__(self, zf, info):
+        self._info = info
+        self._file = open(zf.filename, 'rb')
+        try:
+            _seek_member_data(self._file, info)
+        except BaseException:
+            self._file.close()
+            raise
+        self._remaining = info.compress_size
+        self._inflater = isal_zlib.decompressobj(-15)
+        self._pending = b''
+        self._crc = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        while not self._inflater.eof:
+            if not self._pending and self._remaining:
+                self._pending = self._file.read(min(self.READ_CHUNK, self._remaining))
+                self._remaining -= len(self._pending)
+            # Called with no new input too, to drain output held back by len(view)
+            data = self._inflater.decompress(self._pending, len(view))
+            self._pending = self._inflater.unconsumed_tail
+            if data:
+                view[:len(data)] = data
+                self._crc = isal_zlib.crc32(data, self._crc)
+                return len(data)
+            if not self._pending and not self._remaining and not self._inflater.eof:
+                raise zipfile.BadZipFile(f"Truncated data for {self._info.filename}")
+
+        if self._crc != self._info.CRC:
+            raise zipfile.BadZipFile(f"CRC mismatch for {self._info.filename}")
+        return 0
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+        super().close()
+
+
+def read_zip_member(zf, info):
+    """
+    Return the uncompressed bytes of one ZIP member.
+
+    DEFLATE members are inflated with ISA-L (python-isal) when it is installed,
+    into an output buffer presized from the uncompressed size recorded in the
+    central directory. Everything else goes through zipfile.
+    """
+    if not _isal_inflatable(zf, info):
+        return zf.read(info)
+
+    with open(zf.filename, 'rb') as f:
+        _seek_member_data(f, info)
+        raw = f.read(info.compress_size)
+
+    data = isal_zlib.decompress(raw, wbits=-15, bufsize=max(info.file_size, 1))
+    if isal_zlib.crc32(data) != info.CRC:
+        raise zipfile.BadZipFile(f"CRC mismatch for {info.filename}")
+    return data
+
+
+def open_zip_member(zf, member):
+    """
+    Open one ZIP member for reading as a binary file object.
+
+    With ISA-L installed DEFLATE members are streamed through an incremental
+    ISA-L inflater; otherwise zipfile streams them.
+    """
+    info = zf.getinfo(member)
+    if not _isal_inflatable(zf, info):
+        return zf.open(info)
+    return _IsalMemberReader(zf, info)
+
+
+def extract_member(zf, member, extract_dir):
+    """Extract one ZIP member under extract_dir, inflating it with read_zip_member."""
+    info = zf.getinfo(member)
+    if isal_zlib is None or info.is_dir():
+        return Path(zf.extract(info, extract_dir))
+
+    extract_dir = Path(extract_dir)
+    target_path = extract_dir / member
+    if not target_path.resolve().is_relative_to(extract_dir.resolve()):
+        raise zipfile.BadZipFile(f"Unsafe member path: {member}")
+
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    target_path.write_bytes(read_zip_member(zf, info))
+    return target_path
+
+
 def extract_zip_file(zip_path):
     """Extract ZIP file contents to processed directory."""
     if not zip_path or not zip_path.exists():
@@ -252,18 +847,24 @@ def extract_zip_file(zip_path):
 
     extracted_files = []
 
+    # One directory walk instead of an exists() check per member
+    existing = {path.relative_to(extract_dir).as_posix() for path in extract_dir.rglob('*')}
+
     try:
         with zipfile.ZipFile(zip_path, 'r') as zf:
-            for member in zf.namelist():
-                target_path = extract_dir / member
+            members = zf.infolist()
+            pending = [info for info in members if info.filename.rstrip('/') not in existing]
+
+            if isal_zlib is None:
+                zf.extractall(extract_dir, members=pending)
+            else:
+                for info in pending:
+                    extract_member(zf, info.filename, extract_dir)
 
-                if target_path.exists():
-                    extracted_files.append(target_path)
-                    continue
+            extracted_files = [extract_dir / info.filename for info in members]
 
-                zf.extract(member, extract_dir)
-                extracted_files.append(target_path)
-                print(f"    Extracted: {member}")
+        if pending:
+            print(f"    Extracted {len(pending)} files from {zip_path.name}")
 
     except zipfile.BadZipFile:
         print(f"  Bad ZIP file: {zip_path}")
@@ -273,41 +874,58 @@ def extract_zip_file(zip_path):
     return extracted_files
 
 
-def download_all_y9c_data(start_year=2000, end_year=None):
-    """Download all Y-9C data from start_year to end_year."""
+def download_one_quarter(year, quarter, extract=False, refresh=False):
+    """
+    Download one quarter, trying the Chicago Fed first for pre-2021 data.
+
+    The loader parses members straight out of the ZIP, so the archive is only
+    unpacked into PROCESSED_DIR when extract is set.
+    """
+    if year < 2021:
+        zip_path = download_chicago_fed_data(year, quarter, refresh=refresh)
+        if not zip_path:
+            zip_path = download_nic_data(year, quarter, refresh=refresh)
+    else:
+        zip_path = download_nic_data(year, quarter, refresh=refresh)
+
+    if zip_path and extract:
+        extract_zip_file(zip_path)
+
+    return zip_path
+
+
+def download_all_y9c_data(start_year=2000, end_year=None, max_workers=DOWNLOAD_WORKERS, skip=None,
+                          extract=False, refresh=False):
+    """
+    Download all Y-9C data from start_year to end_year using a pool of worker threads.
+
+    Quarters in skip (a set of (year, quarter) pairs, e.g. those already
+    loaded into the database) are not downloaded. Pass extract=True to also
+    unpack each archive into PROCESSED_DIR, and refresh=True to re-check
+    existing archives against the server with conditional requests.
+    """
     ensure_directories()
 
     if end_year is None:
         end_year = datetime.now().year
 
-    current_quarter = (datetime.now().month - 1) // 3 + 1
-    current_year = datetime.now().year
-
     downloaded_files = {}
 
     print(f"Downloading Y-9C data from {start_year} to {end_year}...")
     print("=" * 60)
 
-    for year in range(start_year, end_year + 1):
-        print(f"\nYear {year}:")
-
-        max_quarter = 4
-        if year == current_year:
-            max_quarter = current_quarter
-
-        for quarter in range(1, max_quarter + 1):
-            if year < 2021:
-                zip_path = download_chicago_fed_data(year, quarter)
-                if not zip_path:
-                    zip_path = download_nic_data(year, quarter)
-            else:
-                zip_path = download_nic_data(year, quarter)
+    quarters = [period for period in all_quarters(start_year, end_year)
+                if not skip or period not in skip]
 
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(download_one_quarter, year, quarter, extract, refresh): (year, quarter)
+            for year, quarter in quarters
+        }
+        for future in as_completed(futures):
+            zip_path = future.result()
             if zip_path:
-                downloaded_files[(year, quarter)] = zip_path
-                extract_zip_file(zip_path)
-
-            time.sleep(1)
+                downloaded_files[futures[future]] = zip_path
 
     print("\n" + "=" * 60)
     print(f"Download complete. {len(downloaded_files)} files downloaded.")
@@ -315,41 +933,59 @@ def download_all_y9c_data(start_year=2000, end_year=None):
     return downloaded_files
 
 
+@functools.lru_cache(maxsize=1)
+def _index_data_files(data_dir, names):
+    """Parse (year, quarter, path) from the data file names; cached per listing."""
+    existing = []
+    for name in names:
+        match = CANONICAL_ZIP_NAME.fullmatch(name)
+        if match:
+            existing.append((int(match[1]), int(match[2]), Path(data_dir) / name))
+
+    return tuple(sorted(existing))
+
+
 def check_existing_data():
     """Check what data files already exist."""
     ensure_directories()
-
-    existing = []
-    for f in DATA_DIR.glob("BHCF_*.zip"):
+    return list(_index_data_files(str(DATA_DIR), existing_data_files()))
+
+
+def verify_existing_data():
+    """
+    Ask the server, with conditional HEAD requests, which saved archives changed.
+
+    Only archives whose validators were recorded when they were downloaded can
+    be checked. Returns the list of (year, quarter, path) found to be stale.
+    """
+    stale = []
+    for year, quarter, path in check_existing_data():
+        url = chicago_fed_url(year, quarter) if path.stem.endswith("_chicago") else nic_url(year, quarter)
+        headers = conditional_headers(url, path)
+        if not headers:
+            print(f"  {path.name}: no validators recorded")
+            continue
         try:
-            parts = f.stem.replace("BHCF_", "").replace("_chicago", "").split("Q")
-            year = int(parts[0])
-            quarter = int(parts[1])
-            existing.append((year, quarter, f))
-        except (ValueError, IndexError):
-            pass
-
-    return sorted(existing)
+            response = get_session().head(url, headers=headers, timeout=DOWNLOAD_TIMEOUT,
+                                          allow_redirects=True)
+        except requests.exceptions.RequestException as e:
+            print(f"  {path.name}: {e}")
+            continue
+        if response.status_code == 304:
+            print(f"  {path.name}: up to date")
+        else:
+            print(f"  {path.name}: changed (HTTP {response.status_code})")
+            stale.append((year, quarter, path))
+    return stale
 
 
 def generate_download_instructions(start_year=2000, end_year=None):
     """Generate manual download instructions for missing quarters."""
     ensure_directories()
 
-    if end_year is None:
-        end_year = datetime.now().year
-
-    current_quarter = (datetime.now().month - 1) // 3 + 1
-    current_year = datetime.now().year
-
     existing = {(y, q) for y, q, _ in check_existing_data()}
 
-    missing = []
-    for year in range(start_year, end_year + 1):
-        max_quarter = 4 if year < current_year else current_quarter
-        for quarter in range(1, max_quarter + 1):
-            if (year, quarter) not in existing:
-                missing.append((year, quarter))
+    missing = sorted(set(all_quarters(start_year, end_year)) - existing)
 
     if not missing:
         print("All data files are present!")
@@ -357,40 +993,48 @@ def generate_download_instructions(start_year=2000, end_year=None):
 
     instructions_file = Path(__file__).parent.parent.parent / "DOWNLOAD_INSTRUCTIONS.txt"
 
-    with open(instructions_file, 'w') as f:
-        f.write("=" * 70 + "\n")
-        f.write("Y-9C DATA MANUAL DOWNLOAD INSTRUCTIONS\n")
-        f.write("=" * 70 + "\n\n")
-
-        f.write(f"Missing quarters: {len(missing)}\n\n")
-
-        f.write("STEP 1: Go to the FFIEC Financial Data Download page:\n")
-        f.write(f"        {FFIEC_DOWNLOAD_URL}\n\n")
-
-        f.write("STEP 2: For each quarter below, do the following:\n")
-        f.write("        a) Select Report Type: BHCF (FR Y-9C)\n")
-        f.write("        b) Select the Year\n")
-        f.write("        c) Select the Quarter\n")
-        f.write("        d) Click 'Download'\n")
-        f.write("        e) Save the ZIP file\n\n")
-
-        f.write("STEP 3: Place all downloaded files in:\n")
-        f.write(f"        {MANUAL_DOWNLOAD_DIR}\n\n")
-
-        f.write("STEP 4: Re-run the scraper:\n")
-        f.write("        python -m src.y9c.cli --init\n\n")
+    lines = [
+        "=" * 70,
+        "Y-9C DATA MANUAL DOWNLOAD INSTRUCTIONS",
+        "=" * 70,
+        "",
+        f"Missing quarters: {len(missing)}",
+        "",
+        "STEP 1: Go to the FFIEC Financial Data Download page:",
+        f"        {FFIEC_DOWNLOAD_URL}",
+        "",
+        "STEP 2: For each quarter below, do the following:",
+        "        a) Select Report Type: BHCF (FR Y-9C)",
+        "        b) Select the Year",
+        "        c) Select the Quarter",
+        "        d) Click 'Download'",
+        "        e) Save the ZIP file",
+        "",
+        "STEP 3: Place all downloaded files in:",
+        f"        {MANUAL_DOWNLOAD_DIR}",
+        "",
+        "STEP 4: Re-run the scraper:",
+        "        python -m src.y9c.cli --init",
+        "",
+        "-" * 70,
+        "QUARTERS TO DOWNLOAD:",
+        "-" * 70,
+        "",
+    ]
 
-        f.write("-" * 70 + "\n")
-        f.write("QUARTERS TO DOWNLOAD:\n")
-        f.write("-" * 70 + "\n\n")
+    for year, quarter in missing:
+        date_str = get_quarter_dates(year, quarter)
+        lines.append(f"  [ ] {year} Q{quarter}  (Report Date: {date_str[:4]}-{date_str[4:6]}-{date_str[6:]})")
 
-        for year, quarter in missing:
-            date_str = get_quarter_dates(year, quarter)
-            f.write(f"  [ ] {year} Q{quarter}  (Report Date: {date_str[:4]}-{date_str[4:6]}-{date_str[6:]})\n")
+    lines += [
+        "",
+        "=" * 70,
+        f"Total files to download: {len(missing)}",
+        "=" * 70,
+        "",
+    ]
 
-        f.write("\n" + "=" * 70 + "\n")
-        f.write(f"Total files to download: {len(missing)}\n")
-        f.write("=" * 70 + "\n")
+    instructions_file.write_text("\n".join(lines))
 
     print(f"\nDownload instructions saved to: {instructions_file}")
     print(f"Missing quarters: {len(missing)}")
@@ -405,20 +1049,16 @@ def print_missing_quarters(start_year=2000, end_year=None):
     if end_year is None:
         end_year = datetime.now().year
 
-    current_quarter = (datetime.now().month - 1) // 3 + 1
-    current_year = datetime.now().year
-
     existing = {(y, q) for y, q, _ in check_existing_data()}
 
     print(f"\nData Coverage Summary ({start_year} - {end_year}):")
     print("-" * 50)
 
     missing_count = 0
-    for year in range(start_year, end_year + 1):
-        max_quarter = 4 if year < current_year else current_quarter
+    for year, periods in itertools.groupby(all_quarters(start_year, end_year), key=lambda period: period[0]):
         year_status = []
 
-        for quarter in range(1, max_quarter + 1):
+        for _, quarter in periods:
             if (year, quarter) in existing:
                 year_status.append(f"Q{quarter}[OK]")
             else:
@@ -442,6 +1082,12 @@ if __name__ == "__main__":
     parser.add_argument("--check", action="store_true")
     parser.add_argument("--status", action="store_true")
     parser.add_argument("--instructions", action="store_true")
+    parser.add_argument("--workers", type=int, default=DOWNLOAD_WORKERS,
+                        help="number of quarters to download in parallel")
+    parser.add_argument("--refresh", action="store_true",
+                        help="re-check existing files with conditional requests")
+    parser.add_argument("--verify", action="store_true",
+                        help="report which existing files changed on the server (HEAD only)")
 
     args = parser.parse_args()
 
@@ -454,5 +1100,8 @@ if __name__ == "__main__":
         print_missing_quarters(args.start_year, args.end_year)
     elif args.instructions:
         generate_download_instructions(args.start_year, args.end_year)
+    elif args.verify:
+        verify_existing_data()
     else:
-        download_all_y9c_data(args.start_year, args.end_year)
+        download_all_y9c_data(args.start_year, args.end_year, max_workers=args.workers,
+                              refresh=args.refresh)
@@ -9,19 +9,64 @@ This module handles:
 3. Loading filtered data into SQLite database
 """
 
+import contextlib
+import csv
+import functools
+import hashlib
+import importlib.util
+import io
+import itertools
+import os
+import re
+import sqlite3
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from .config import get_mdrm_codes_list, USAA_HOLDING_COMPANY_RSSD
-from .database import bulk_insert_financial_data, record_load, get_loaded_quarters, get_connection
+from .database import (
+    batch_writes,
+    bulk_load_mode,
+    bulk_insert_financial_data,
+    create_financial_data_indexes,
+    has_financial_data,
+    record_load,
+    get_loaded_quarters,
+    get_connection,
+    refresh_dashboard_view,
+)
+from .downloader import all_quarters, existing_data_files, extract_member, open_zip_member
 
 # Data directories at project root
 DATA_DIR = Path(__file__).parent.parent.parent / "data" / "raw"
 PROCESSED_DIR = Path(__file__).parent.parent.parent / "data" / "processed"
 
+# Y-9C data files inside the bulk ZIPs (readme/schema text files are skipped)
+DATA_MEMBER_RE = re.compile(r'(^|/)BHCF[^/]*\.(txt|csv)$', re.IGNORECASE)
+
+# Month and day each quarter ends, indexed by quarter - 1
+QUARTER_END_DATES = ('03-31', '06-30', '09-30', '12-31')
+
+# Columns holding the institution's RSSD ID, in order of preference
+RSSD_KEYS = ('IDRSSD', 'RSSD9001', 'RSSD')
+
+# Rows tokenized per pandas chunk, so a large file never sits in memory whole
+PARSE_CHUNK_ROWS = 10000
+
+# Quarters with archives at which load_all_data drops the secondary indexes
+# and rebuilds them afterwards; smaller loads insert with them in place
+BULK_LOAD_MIN_QUARTERS = 8
+
+# Read buffer for data files; rows run to tens of KB, so the 8 KB default
+# means several reads per line
+READ_BUFFER_SIZE = 4 << 20
 
-def parse_caret_delimited_file(file_path, target_rssd=None, mdrm_filter=None):
+
+def parse_caret_delimited_file(file_path, target_rssd=None, mdrm_filter=None, errors=None):
     """
     Parse a caret-delimited (^) text file from FFIEC.
 
@@ -29,130 +74,330 @@ def parse_caret_delimited_file(file_path, target_rssd=None, mdrm_filter=None):
         file_path: Path to the text file
         target_rssd: If specified, only return data for this institution
         mdrm_filter: List of MDRM codes to include (None = all)
+        errors: List to append a message to for each failure (None = print only)
 
-    Returns:
-        List of dictionaries with parsed data
+    Yields:
+        DataFrames of parsed data, one column per kept header (upper-cased),
+        at most PARSE_CHUNK_ROWS rows each
     """
-    records = []
-
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            header_line = f.readline().strip()
-            headers = header_line.split('^')
-            headers = [h.strip().upper() for h in headers]
+        with open(file_path, 'r', encoding='utf-8', errors='replace', buffering=READ_BUFFER_SIZE) as fh:
+            yield from parse_caret_delimited_fh(fh, target_rssd, mdrm_filter, source=file_path, errors=errors)
+    except OSError as e:
+        print(f"  Error parsing {file_path}: {e}")
+        if errors is not None:
+            errors.append(f"{file_path}: {e}")
+
 
-            rssd_col = None
-            for i, h in enumerate(headers):
-                if 'RSSD' in h or h == 'IDRSSD':
-                    rssd_col = i
-                    break
+@functools.lru_cache(maxsize=64)
+def _header_layout(header_line, wanted):
+    """
+    Parse a header line into (headers, rssd_col, usecols).
 
-            if rssd_col is None:
-                print(f"  Warning: Could not find RSSD column in {file_path}")
-                return records
+    headers are stripped and upper-cased; rssd_col is the first of RSSD_KEYS
+    present, as preferred by extract_financial_data. usecols are the column
+    indices to read, in order: the RSSD_KEYS columns plus those named in
+    wanted (all columns when wanted is None). Cached because a quarter's
+    files, and successive quarters, mostly share the same header lines.
+    """
+    headers = tuple(h.strip().upper() for h in header_line.rstrip('\r\n').split('^'))
 
-            for line in f:
-                values = line.strip().split('^')
+    rssd_col = next((headers.index(key) for key in RSSD_KEYS if key in headers), None)
 
-                if len(values) != len(headers):
-                    continue
+    if wanted is None:
+        usecols = tuple(range(len(headers)))
+    else:
+        usecols = tuple(i for i, h in enumerate(headers) if h in RSSD_KEYS or h in wanted)
 
-                rssd = values[rssd_col].strip()
-                if target_rssd and rssd != target_rssd:
-                    continue
+    return headers, rssd_col, usecols
 
-                record = {}
-                for i, header in enumerate(headers):
-                    record[header] = values[i].strip() if i < len(values) else ''
 
-                records.append(record)
+def parse_caret_delimited_fh(fh, target_rssd=None, mdrm_filter=None, source=None, errors=None):
+    """
+    Parse caret-delimited FFIEC data from an open text file handle.
 
-    except Exception as e:
-        print(f"  Error parsing {file_path}: {e}")
+    The rows are tokenized by pandas' C parser in batches of PARSE_CHUNK_ROWS,
+    reading only the RSSD column and the MDRM columns in mdrm_filter.
+    Arguments and frames are as for parse_caret_delimited_file; source names
+    the data in messages.
+    """
+    source = source or getattr(fh, 'name', 'input')
 
-    return records
+    try:
+        wanted = None if mdrm_filter is None else frozenset(code.upper() for code in mdrm_filter)
+        headers, rssd_col, usecols = _header_layout(fh.readline(), wanted)
+
+        if rssd_col is None:
+            print(f"  Warning: Could not find RSSD column in {source}")
+            if errors is not None:
+                errors.append(f"{source}: no RSSD column")
+            return
+
+        # Rows whose field count doesn't match the header are dropped here:
+        # pandas would pad short rows and, with usecols, truncate long ones.
+        # A substring test on the raw lines is also far cheaper than tokenizing
+        # every institution's row; the exact RSSD match is applied below
+        separators = len(headers) - 1
+        needle = str(target_rssd) if target_rssd else ''
+        lines = (line for line in fh if line.count('^') == separators and needle in line)
+
+        columns = [headers[i] for i in usecols]
+        rssd_name = headers[rssd_col]
+
+        while batch := ''.join(itertools.islice(lines, PARSE_CHUNK_ROWS)):
+            df = pd.read_csv(
+                io.StringIO(batch), sep='^', header=None, usecols=list(usecols), dtype=str,
+                keep_default_na=False, quoting=csv.QUOTE_NONE, engine='c',
+            )
+            df.columns = columns
+
+            # Only the RSSD needs stripping: pd.to_numeric ignores the padding
+            # around values when extract_financial_data converts them
+            df[rssd_name] = df[rssd_name].fillna('').str.strip()
+            if target_rssd:
+                df = df[df[rssd_name] == target_rssd]
+            if df.empty:
+                continue
+
+            yield df
+
+    except pd.errors.EmptyDataError:
+        pass
+    except Exception as e:
+        print(f"  Error parsing {source}: {e}")
+        if errors is not None:
+            errors.append(f"{source}: {e}")
 
 
-def extract_financial_data(records, year, quarter, mdrm_filter=None):
+def extract_financial_data(frames, year, quarter, mdrm_filter=None):
     """
     Extract financial data from parsed records.
 
     Args:
-        records: List of record dictionaries
+        frames: Iterable of DataFrames from parse_caret_delimited_file
         year: Reporting year
         quarter: Reporting quarter (1-4)
         mdrm_filter: List of MDRM codes to extract
 
-    Returns:
-        List of tuples (rssd_id, report_date, year, quarter, mdrm_code, value)
+    Yields:
+        Tuples (rssd_id, report_date, year, quarter, mdrm_code, value)
     """
     if mdrm_filter is None:
         mdrm_filter = get_mdrm_codes_list()
 
-    quarter_ends = {1: '03-31', 2: '06-30', 3: '09-30', 4: '12-31'}
-    report_date = f"{year}-{quarter_ends[quarter]}"
+    report_date = f"{year}-{QUARTER_END_DATES[quarter - 1]}"
 
-    data_tuples = []
+    # Headers are upper-cased by the parser, so look columns up by upper-cased code
+    mdrm_by_key = {mdrm.upper(): mdrm for mdrm in mdrm_filter}
 
-    for record in records:
-        rssd = record.get('IDRSSD') or record.get('RSSD9001') or record.get('RSSD')
-        if not rssd:
-            continue
+    for df in frames:
+        df = df.fillna('')
 
-        for mdrm in mdrm_filter:
-            value = record.get(mdrm) or record.get(mdrm.upper())
-
-            if value and value not in ('', 'NA', 'N/A', '.'):
-                try:
-                    numeric_value = float(value.replace(',', ''))
-                    data_tuples.append((
-                        rssd,
-                        report_date,
-                        year,
-                        quarter,
-                        mdrm,
-                        numeric_value
-                    ))
-                except ValueError:
-                    pass
-
-    return data_tuples
+        # First non-empty RSSD column of each row
+        rssd = pd.Series('', index=df.index)
+        for key in reversed(RSSD_KEYS):
+            if key in df:
+                rssd = df[key].where(df[key] != '', rssd)
 
+        codes = [key for key in df.columns if key in mdrm_by_key]
+        if not codes:
+            continue
 
-def process_zip_file(zip_path, target_rssd=None, mdrm_filter=None):
-    """Process a ZIP file containing Y-9C data."""
-    records = []
+        # Parse whole columns at once; cells FFIEC leaves unreported ('', 'NA',
+        # 'N/A', '.') and anything else non-numeric become NaN and are dropped
+        values = df[codes].apply(
+            lambda column: pd.to_numeric(column.str.replace(',', '', regex=False), errors='coerce')
+        )
+        values.index = rssd
+        values = values[rssd.to_numpy() != '']
+
+        cells = values.stack().dropna()
+        cells = cells[np.isfinite(cells)]
+        # Reported in whole thousands of dollars
+        amounts = cells.round().astype('int64').tolist()
+
+        for (rssd_id, key), amount in zip(cells.index, amounts):
+            yield (
+                rssd_id,
+                report_date,
+                year,
+                quarter,
+                mdrm_by_key[key],
+                amount
+            )
+
+
+def process_zip_file(zip_path, target_rssd=None, mdrm_filter=None, keep_extracted=False, errors=None):
+    """
+    Process a ZIP file containing Y-9C data.
 
+    Members are parsed straight from the archive; with keep_extracted they are
+    also written under PROCESSED_DIR and parsed from there. DataFrames of
+    records are yielded as they are parsed. Failures are printed and, when
+    errors is a list, a message for each is appended to it.
+    """
     try:
         extract_dir = PROCESSED_DIR / Path(zip_path).stem
-        extract_dir.mkdir(parents=True, exist_ok=True)
+        if keep_extracted:
+            extract_dir.mkdir(parents=True, exist_ok=True)
 
         with zipfile.ZipFile(zip_path, 'r') as zf:
             for member in zf.namelist():
-                if member.lower().endswith('.txt') or member.lower().endswith('.csv'):
-                    extracted_path = extract_dir / member
-
-                    if not extracted_path.exists():
-                        zf.extract(member, extract_dir)
-                        print(f"    Extracted: {member}")
-
-                    file_records = parse_caret_delimited_file(
-                        extracted_path,
-                        target_rssd=target_rssd,
-                        mdrm_filter=mdrm_filter
-                    )
-                    records.extend(file_records)
-                    print(f"    Found {len(file_records)} records for target RSSD")
+                if DATA_MEMBER_RE.search(member):
+                    found = 0
+                    if keep_extracted:
+                        extracted_path = extract_dir / member
+
+                        if not extracted_path.exists():
+                            extract_member(zf, member, extract_dir)
+                            print(f"    Extracted: {member}")
+
+                        for frame in parse_caret_delimited_file(
+                            extracted_path,
+                            target_rssd=target_rssd,
+                            mdrm_filter=mdrm_filter,
+                            errors=errors
+                        ):
+                            found += len(frame)
+                            yield frame
+                    else:
+                        with open_zip_member(zf, member) as raw, \
+                                io.TextIOWrapper(io.BufferedReader(raw, READ_BUFFER_SIZE),
+                                                 encoding='utf-8', errors='replace') as fh:
+                            for frame in parse_caret_delimited_fh(
+                                fh,
+                                target_rssd=target_rssd,
+                                mdrm_filter=mdrm_filter,
+                                source=member,
+                                errors=errors
+                            ):
+                                found += len(frame)
+                                yield frame
+                    print(f"    Found {found} records for target RSSD")
 
     except zipfile.BadZipFile:
         print(f"  Bad ZIP file: {zip_path}")
+        if errors is not None:
+            errors.append(f"{zip_path}: bad ZIP file")
     except Exception as e:
         print(f"  Error processing {zip_path}: {e}")
+        if errors is not None:
+            errors.append(f"{zip_path}: {e}")
+
 
-    return records
+def records_cache_path(zip_path, target_rssd, mdrm_filter):
+    """
+    Parquet file under PROCESSED_DIR caching target_rssd's records from zip_path.
+
+    The name is keyed on the archive's size and mtime and on the RSSD and
+    MDRM codes, so a refreshed archive or a changed code list is parsed afresh.
+    """
+    stat = Path(zip_path).stat()
+    key = repr((stat.st_size, stat.st_mtime_ns, str(target_rssd), sorted(mdrm_filter)))
+    return PROCESSED_DIR / f"{Path(zip_path).stem}_{hashlib.sha256(key.encode()).hexdigest()[:16]}.parquet"
 
 
-def load_quarter(year, quarter, target_rssd=USAA_HOLDING_COMPANY_RSSD, force=False):
+def parse_into_cache(zip_path, target_rssd, mdrm_filter):
+    """
+    Parse zip_path and write target_rssd's records to records_cache_path().
+
+    Only a clean parse is cached, so a damaged archive or member is retried
+    on the next load; a clean parse that found nothing is cached as an empty
+    table. Needs pyarrow. Returns (frames, cached).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    errors = []
+    frames = list(process_zip_file(zip_path, target_rssd=target_rssd, mdrm_filter=mdrm_filter, errors=errors))
+    if errors:
+        return frames, False
+
+    records = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    table = pa.Table.from_pandas(records, preserve_index=False)
+    cache_path = records_cache_path(zip_path, target_rssd, mdrm_filter)
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+    part_path = cache_path.with_name(cache_path.name + '.part')
+    pq.write_table(table, part_path, compression='zstd')
+    part_path.replace(cache_path)
+    return frames, True
+
+
+def records_cacheable(target_rssd):
+    """Whether cached_zip_records can keep target_rssd's records: needs pyarrow and a single institution."""
+    return bool(target_rssd) and importlib.util.find_spec('pyarrow') is not None
+
+
+def cached_zip_records(zip_path, target_rssd, mdrm_filter):
+    """
+    Record frames for target_rssd from zip_path, kept in a Parquet cache under PROCESSED_DIR.
+
+    See records_cache_path and parse_into_cache. Without pyarrow, or with no
+    target_rssd (every institution, which is streamed instead), the archive
+    is parsed each time.
+    """
+    if not records_cacheable(target_rssd):
+        return process_zip_file(zip_path, target_rssd=target_rssd, mdrm_filter=mdrm_filter)
+    import pyarrow.parquet as pq
+
+    cache_path = records_cache_path(zip_path, target_rssd, mdrm_filter)
+    if cache_path.exists():
+        print(f"    Using cached records: {cache_path.name}")
+        return [pq.read_table(cache_path).to_pandas()]
+
+    frames, _ = parse_into_cache(zip_path, target_rssd, mdrm_filter)
+    return frames
+
+
+def find_quarter_file(year, quarter):
+    """Return the downloaded archive for a quarter, preferring the FFIEC file, or None."""
+    existing = existing_data_files()
+    for name in (f"BHCF_{year}Q{quarter}.zip", f"BHCF_{year}Q{quarter}_chicago.zip"):
+        if name in existing:
+            return DATA_DIR / name
+    return None
+
+
+def insert_quarter(year, quarter, zip_path, frames, target_rssd, mdrm_filter):
+    """
+    Write one quarter's parsed record frames to the database and record the load.
+
+    frames may be any iterable, including a generator streaming from the
+    archive. Returns the number of data points inserted.
+    """
+    # An empty cached table stands for a quarter with no records
+    frames = (frame for frame in frames if not frame.empty)
+
+    # Peek so an empty file is reported without opening a write transaction
+    first = next(frames, None)
+    if first is None:
+        print(f"  No records found for RSSD {target_rssd} in {year} Q{quarter}")
+        record_load(year, quarter, str(zip_path), 0, 'no_data')
+        return 0
+
+    # Rows stream from the archive into the database a batch at a time
+    data_tuples = extract_financial_data(itertools.chain([first], frames), year, quarter, mdrm_filter)
+
+    # Insert the rows and mark the quarter completed in one transaction, so a
+    # failed insert never leaves the quarter recorded as loaded
+    try:
+        with batch_writes() as conn:
+            inserted = bulk_insert_financial_data(data_tuples, conn=conn)
+            if not inserted:
+                print(f"  No matching MDRM codes found in {year} Q{quarter}")
+                record_load(year, quarter, str(zip_path), 0, 'no_matching_codes', conn=conn)
+                return 0
+            record_load(year, quarter, str(zip_path), inserted, 'completed', conn=conn)
+    except sqlite3.Error as e:
+        print(f"  Error loading {year} Q{quarter}: {e}")
+        return 0
+
+    print(f"  Loaded {inserted} data points for {year} Q{quarter}")
+
+    return inserted
+
+
+def load_quarter(year, quarter, target_rssd=USAA_HOLDING_COMPANY_RSSD, force=False, loaded=None):
     """
     Load data for a specific quarter.
 
@@ -161,25 +406,18 @@ def load_quarter(year, quarter, target_rssd=USAA_HOLDING_COMPANY_RSSD, force=Fal
         quarter: Quarter to load (1-4)
         target_rssd: Institution to load
         force: Force reload even if already loaded
+        loaded: Set of already-loaded (year, quarter) pairs; queried if None
 
     Returns:
         Number of records loaded
     """
-    loaded = get_loaded_quarters()
+    if loaded is None:
+        loaded = set(get_loaded_quarters())
     if (year, quarter) in loaded and not force:
         print(f"  {year} Q{quarter} already loaded. Use force=True to reload.")
         return 0
 
-    zip_patterns = [
-        DATA_DIR / f"BHCF_{year}Q{quarter}.zip",
-        DATA_DIR / f"BHCF_{year}Q{quarter}_chicago.zip",
-    ]
-
-    zip_path = None
-    for pattern in zip_patterns:
-        if pattern.exists():
-            zip_path = pattern
-            break
+    zip_path = find_quarter_file(year, quarter)
 
     if not zip_path:
         print(f"  No data file found for {year} Q{quarter}")
@@ -188,50 +426,96 @@ def load_quarter(year, quarter, target_rssd=USAA_HOLDING_COMPANY_RSSD, force=Fal
     print(f"  Processing {zip_path.name}...")
 
     mdrm_filter = get_mdrm_codes_list()
-    records = process_zip_file(zip_path, target_rssd=target_rssd, mdrm_filter=mdrm_filter)
+    frames = cached_zip_records(zip_path, target_rssd, mdrm_filter)
 
-    if not records:
-        print(f"  No records found for RSSD {target_rssd} in {year} Q{quarter}")
-        record_load(year, quarter, str(zip_path), 0, 'no_data')
-        return 0
+    return insert_quarter(year, quarter, zip_path, frames, target_rssd, mdrm_filter)
 
-    data_tuples = extract_financial_data(records, year, quarter, mdrm_filter)
 
-    if not data_tuples:
-        print(f"  No matching MDRM codes found in {year} Q{quarter}")
-        record_load(year, quarter, str(zip_path), 0, 'no_matching_codes')
-        return 0
-
-    bulk_insert_financial_data(data_tuples)
-    print(f"  Loaded {len(data_tuples)} data points for {year} Q{quarter}")
-
-    record_load(year, quarter, str(zip_path), len(data_tuples), 'completed')
+def parse_quarter(zip_path, target_rssd, mdrm_filter):
+    """
+    Parse one quarter's archive into its Parquet cache without touching the database.
 
-    return len(data_tuples)
+    Runs in a load_all_data worker process, only when records_cacheable():
+    nothing but paths crosses between processes, and the parent reads the
+    records back with cached_zip_records.
+    """
+    print(f"  Processing {zip_path.name}...")
+    if not records_cache_path(zip_path, target_rssd, mdrm_filter).exists():
+        parse_into_cache(zip_path, target_rssd, mdrm_filter)
 
 
-def load_all_data(start_year=2000, end_year=None, target_rssd=USAA_HOLDING_COMPANY_RSSD):
-    """Load all available data into the database."""
+def load_all_data(start_year=2000, end_year=None, target_rssd=USAA_HOLDING_COMPANY_RSSD,
+                  max_workers=None):
+    """
+    Load all available data into the database.
+
+    Quarters are parsed into their Parquet caches in parallel by up to
+    max_workers processes (default: one per CPU); their rows are read back
+    and written from this process, since SQLite allows a single writer.
+    When the records can't be cached (see records_cacheable), or there is a
+    single quarter, the quarters are loaded one by one with load_quarter.
+    Into an empty table, or for at least BULK_LOAD_MIN_QUARTERS quarters,
+    the secondary indexes are dropped for the load (see bulk_load_mode).
+    """
     if end_year is None:
         end_year = datetime.now().year
 
-    current_quarter = (datetime.now().month - 1) // 3 + 1
-    current_year = datetime.now().year
-
     total_loaded = 0
+    loaded_quarters = set(get_loaded_quarters())
 
     print(f"Loading Y-9C data for RSSD {target_rssd}...")
     print(f"Period: {start_year} to {end_year}")
     print("=" * 60)
 
-    for year in range(start_year, end_year + 1):
-        max_quarter = 4
-        if year == current_year:
-            max_quarter = current_quarter
-
-        for quarter in range(1, max_quarter + 1):
-            loaded = load_quarter(year, quarter, target_rssd)
-            total_loaded += loaded
+    to_load = []
+    already_loaded = 0
+    missing = 0
+    for year, quarter in all_quarters(start_year, end_year):
+        if (year, quarter) in loaded_quarters:
+            already_loaded += 1
+        elif zip_path := find_quarter_file(year, quarter):
+            to_load.append((year, quarter, zip_path))
+        else:
+            missing += 1
+
+    if already_loaded:
+        print(f"  Skipping {already_loaded} quarters already loaded.")
+    if missing:
+        print(f"  No data file found for {missing} quarters.")
+
+    if to_load:
+        mdrm_filter = get_mdrm_codes_list()
+        workers = min(max_workers or os.cpu_count() or 1, len(to_load))
+
+        # Indexes are rebuilt once after a full restore instead of per insert;
+        # a few new quarters go in with them in place
+        if len(to_load) >= BULK_LOAD_MIN_QUARTERS or not has_financial_data():
+            index_mode = bulk_load_mode()
+        else:
+            # Puts back any indexes an interrupted bulk load left dropped
+            conn = get_connection()
+            create_financial_data_indexes(conn)
+            conn.commit()
+            index_mode = contextlib.nullcontext()
+
+        with index_mode:
+            if len(to_load) == 1 or not records_cacheable(target_rssd):
+                for year, quarter, _ in to_load:
+                    total_loaded += load_quarter(year, quarter, target_rssd, loaded=loaded_quarters)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(parse_quarter, zip_path, target_rssd, mdrm_filter): (year, quarter, zip_path)
+                        for year, quarter, zip_path in to_load
+                    }
+                    for future in as_completed(futures):
+                        year, quarter, zip_path = futures[future]
+                        future.result()
+                        frames = cached_zip_records(zip_path, target_rssd, mdrm_filter)
+                        total_loaded += insert_quarter(year, quarter, zip_path, frames, target_rssd, mdrm_filter)
+
+    if total_loaded:
+        refresh_dashboard_view()
 
     print("=" * 60)
     print(f"Total: {total_loaded} data points loaded")
@@ -244,25 +528,22 @@ def incremental_update(target_rssd=USAA_HOLDING_COMPANY_RSSD):
     loaded_quarters = set(get_loaded_quarters())
 
     current_year = datetime.now().year
-    current_quarter = (datetime.now().month - 1) // 3 + 1
 
     new_loaded = 0
 
     print("Checking for new data...")
 
-    for year in range(current_year - 1, current_year + 1):
-        max_quarter = 4 if year < current_year else current_quarter
-
-        for quarter in range(1, max_quarter + 1):
-            if (year, quarter) not in loaded_quarters:
-                print(f"  Found missing: {year} Q{quarter}")
-                loaded = load_quarter(year, quarter, target_rssd)
-                new_loaded += loaded
+    for year, quarter in all_quarters(current_year - 1):
+        if (year, quarter) not in loaded_quarters:
+            print(f"  Found missing: {year} Q{quarter}")
+            loaded = load_quarter(year, quarter, target_rssd, loaded=loaded_quarters)
+            new_loaded += loaded
 
     if new_loaded == 0:
         print("  No new data to load.")
     else:
         print(f"  Loaded {new_loaded} new data points.")
+        refresh_dashboard_view()
 
     return new_loaded
 
@@ -289,8 +570,6 @@ def validate_data():
     for row in cursor.fetchall():
         print(f"{row['year']:<6}{row['quarter']:<6}{row['code_count']:<15}{row['record_count']:<10}")
 
-    conn.close()
-
 
 if __name__ == "__main__":
     import argparse